@@ -121,7 +121,7 @@ async def chat(request: Request, data: ChatRequest):
         # If response looks like raw HTML book cards, transform to plain JSON format
         if isinstance(response, str) and '<div class="book-card"' in response:
             from bs4 import BeautifulSoup  # lightweight parse of our own HTML structure
-            soup = BeautifulSoup(response, 'html.parser')
+            soup = BeautifulSoup(response, nandu_brain.HTML_PARSER)
             cards = soup.select('div.book-card')
             books_raw = []
             
@@ -130,30 +130,19 @@ async def chat(request: Request, data: ChatRequest):
                 h4 = card.find('h4')
                 title = h4.get_text(strip=True) if h4 else ''
                 
-                # Extract author
-                author = ''
+                # Extract author, year and ISBN in one pass over the card's paragraphs
+                # (None = not seen yet; the first matching paragraph wins for each field)
+                author = year = isbn = None
                 for p in card.find_all('p'):
                     txt = p.get_text(' ', strip=True)
-                    if txt.startswith('Author:'):
+                    if author is None and txt.startswith('Author:'):
                         author = txt.replace('Author:', '').strip()
-                        break
-                
-                # Extract year
-                year = ''
-                for p in card.find_all('p'):
-                    txt = p.get_text(' ', strip=True)
-                    if txt.startswith('Published:'):
+                    elif year is None and txt.startswith('Published:'):
                         m = re.search(r'(19|20)\d{2}', txt)
                         year = m.group(0) if m else ''
-                        break
-                
-                # Extract ISBN
-                isbn = ''
-                for p in card.find_all('p'):
-                    txt = p.get_text(' ', strip=True)
-                    if txt.startswith('ISBN:'):
+                    elif isbn is None and txt.startswith('ISBN:'):
                         isbn = txt.replace('ISBN:', '').strip()
-                        break
+                author, year, isbn = author or '', year or '', isbn or ''
                 
                 # Extract copies and call numbers from book-meta div
                 copies = 0
@@ -357,9 +346,9 @@ async def admin_clear_cache(request: Request):
         # Best-effort clears based on available symbols
         cleared = {}
         try:
-            if hasattr(nandu_brain, "classification_cache"):
-                nandu_brain.classification_cache.clear()
-                cleared["classification_cache"] = True
+            # Classification, embedding, FAQ and statistics caches
+            nandu_brain.clear_caches()
+            cleared["classification_cache"] = True
         except Exception:
             cleared["classification_cache"] = False
         try:
@@ -538,12 +527,15 @@ async def admin_index_status(request: Request):
     """Return presence, size and mtime for FAISS indices and data files."""
     
     def info(p: Path):
-        if not p.exists():
+        # One stat() per file serves the existence check, size and mtime
+        try:
+            st = p.stat()
+        except FileNotFoundError:
             return {"exists": False}
         return {
             "exists": True,
-            "size": p.stat().st_size,
-            "modified": datetime.fromtimestamp(p.stat().st_mtime).isoformat()
+            "size": st.st_size,
+            "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
         }
 
     payload = {
@@ -636,7 +628,7 @@ async def stats():
         return {
             "total_clients": len(nandu_brain._rate_limiter),
             "error_count": nandu_brain._error_tracker["count"],
-            "classification_cache_size": len(nandu_brain.classification_cache),
+            "classification_cache_size": nandu_brain.classify_query.cache_info().currsize,
         }
     except Exception as e:
         return {"error": str(e)}
@@ -10,6 +10,7 @@ Run once to build index:
 Outputs:
     - general_queries_index.faiss (vector index)
     - general_queries_mapping.pkl (question->answer mapping)
+    - general_queries_mapping.arrow (same mapping, memory-mappable; needs pyarrow)
 """
 
 import json
@@ -17,6 +18,65 @@ import pickle
 import numpy as np
 from pathlib import Path
 
+def write_arrow_mapping(mapping, output_path):
+    """
+    Write the mapping as an Arrow IPC file that the server memory-maps instead of unpickling.
+    Nested values (dicts/lists) are stored as JSON strings in columns tagged {"json": "1"}.
+    Returns False (pickle only) when pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+    except ImportError:
+        print("   pyarrow not installed - skipping Arrow mapping (server will use the pickle)")
+        return False
+
+    column_names = list(dict.fromkeys(key for row in mapping for key in row))
+    fields, arrays = [], []
+    for name in column_names:
+        values = [row.get(name) for row in mapping]
+        if any(isinstance(v, (dict, list)) for v in values):
+            values = [None if v is None else json.dumps(v, ensure_ascii=False) for v in values]
+            fields.append(pa.field(name, pa.string(), metadata={"json": "1"}))
+            arrays.append(pa.array(values, type=pa.string()))
+        else:
+            array = pa.array(values)
+            fields.append(pa.field(name, array.type))
+            arrays.append(array)
+
+    table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+    with pa.OSFile(str(output_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return True
+
+# IVF needs ~39 training points per list; below this many lists use a flat 8-bit index
+MIN_IVF_LISTS = 16
+
+def build_quantized_index(embeddings):
+    """
+    Build an 8-bit scalar-quantized inner-product index over normalized embeddings.
+
+    Vectors are stored as int8 codes (4x smaller than float32). With enough questions
+    the index is also partitioned (IndexIVFScalarQuantizer) so a search scans only the
+    nprobe closest lists; the server sets nprobe when it loads the index.
+    """
+    import faiss
+
+    count, dimension = embeddings.shape
+    nlist = min(4 * int(np.sqrt(count)), count // 39)
+    if nlist < MIN_IVF_LISTS:
+        index = faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+        print(f"   Type: IndexScalarQuantizer (8-bit, {count} vectors too few for IVF)")
+    else:
+        quantizer = faiss.IndexFlatIP(dimension)
+        index = faiss.IndexIVFScalarQuantizer(
+            quantizer, dimension, nlist, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+        print(f"   Type: IndexIVFScalarQuantizer (8-bit, nlist={nlist})")
+    index.train(embeddings)
+    index.add(embeddings)
+    return index
+
 def build_general_queries_index():
     """
     Build FAISS index from general_queries.json for semantic search.
@@ -27,6 +87,7 @@ def build_general_queries_index():
     GENERAL_QUERIES_FILE = BASE_DIR / "general_queries.json"
     INDEX_OUTPUT = BASE_DIR / "general_queries_index.faiss"
     MAPPING_OUTPUT = BASE_DIR / "general_queries_mapping.pkl"
+    ARROW_MAPPING_OUTPUT = BASE_DIR / "general_queries_mapping.arrow"
     MODEL_PATH = BASE_DIR / "models" / "all-MiniLM-L6-v2"
     
     print("=" * 60)
@@ -85,6 +146,8 @@ def build_general_queries_index():
     print(f"\nEncoding {len(questions)} questions into embeddings...")
     embeddings = model.encode(questions, show_progress_bar=True, convert_to_numpy=True)
     embeddings = embeddings.astype('float32')
+    # Unit-length vectors make inner product equal to cosine similarity
+    faiss.normalize_L2(embeddings)
     
     print(f"SUCCESS: Generated embeddings (shape: {embeddings.shape})")
     
@@ -93,9 +156,8 @@ def build_general_queries_index():
     dimension = embeddings.shape[1]  # Should be 384 for all-MiniLM-L6-v2
     print(f"   Dimension: {dimension}")
     
-    # Use L2 distance (Euclidean) - works well for normalized embeddings
-    index = faiss.IndexFlatL2(dimension)
-    index.add(embeddings)
+    # Inner product over normalized embeddings: search scores are cosine similarities
+    index = build_quantized_index(embeddings)
     
     print(f"SUCCESS: FAISS index built with {index.ntotal} vectors")
     
@@ -120,6 +182,11 @@ def build_general_queries_index():
     print(f"Saved mapping to: {MAPPING_OUTPUT.name}")
     print(f"   Size: {MAPPING_OUTPUT.stat().st_size / 1024:.2f} KB")
     
+    # Written after the pickle so the loader sees it as up to date
+    if write_arrow_mapping(mapping, ARROW_MAPPING_OUTPUT):
+        print(f"Saved Arrow mapping to: {ARROW_MAPPING_OUTPUT.name}")
+        print(f"   Size: {ARROW_MAPPING_OUTPUT.stat().st_size / 1024:.2f} KB")
+    
     # Test the index
     print("\n" + "=" * 60)
     print("Testing Index with Sample Queries")
@@ -133,16 +200,17 @@ def build_general_queries_index():
         "library contact number"
     ]
     
+    if hasattr(index, 'nprobe'):
+        index.nprobe = 8  # Same default as the server (NANDU_IVF_NPROBE)
+    
     for test_query in test_queries:
         print(f"\nQuery: '{test_query}'")
-        test_embedding = model.encode([test_query])
-        distances, indices = index.search(test_embedding, k=3)
-        
-        # Convert L2 distance to similarity percentage
-        similarities = [1 / (1 + dist) for dist in distances[0]]
+        test_embedding = model.encode([test_query]).astype('float32')
+        faiss.normalize_L2(test_embedding)
+        similarities, indices = index.search(test_embedding, k=3)
         
         print("   Top 3 matches:")
-        for i, (sim, idx) in enumerate(zip(similarities, indices[0]), 1):
+        for i, (sim, idx) in enumerate(zip(similarities[0], indices[0]), 1):
             match = mapping[idx]
             print(f"   {i}. [{sim*100:.1f}%] {match['question'][:60]}")
     
@@ -152,6 +220,8 @@ def build_general_queries_index():
     print("\nGenerated Files:")
     print(f"   * {INDEX_OUTPUT.name}")
     print(f"   * {MAPPING_OUTPUT.name}")
+    if ARROW_MAPPING_OUTPUT.exists():
+        print(f"   * {ARROW_MAPPING_OUTPUT.name}")
     print("\nReady to use FAISS semantic search for general queries!")
     
     return True
@@ -0,0 +1,113 @@
+"""
+Catalogue database schema migrations shared by the chatbot backend and the importer.
+
+PRAGMA user_version records how many migrations a catalogue.db has applied:
+nandu_brain upgrades existing databases on startup, and reimport_catalogue.py
+applies them right after a bulk load so a fresh database is search-ready.
+"""
+
+import sqlite3
+
+CATALOGUE_MIGRATIONS = [
+    # 1: expression indexes for exact, case-insensitive title/author/ISBN/call number lookups
+    """
+    CREATE INDEX IF NOT EXISTS idx_catalogue_title_lc ON catalogue(LOWER(title));
+    CREATE INDEX IF NOT EXISTS idx_catalogue_author_lc ON catalogue(LOWER(author));
+    CREATE INDEX IF NOT EXISTS idx_catalogue_isbn_lc ON catalogue(LOWER(isbn));
+    CREATE INDEX IF NOT EXISTS idx_catalogue_call_number_lc ON catalogue(LOWER(call_number));
+    CREATE INDEX IF NOT EXISTS idx_catalogue_isbn ON catalogue(isbn);
+    """,
+    # 2: FTS5 inverted index over the searched fields, kept in sync with triggers
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS catalogue_fts USING fts5(
+        title, author, isbn, call_number,
+        content='catalogue', tokenize='unicode61 remove_diacritics 2'
+    );
+    CREATE TRIGGER IF NOT EXISTS catalogue_fts_ai AFTER INSERT ON catalogue BEGIN
+        INSERT INTO catalogue_fts(rowid, title, author, isbn, call_number)
+        VALUES (new.rowid, new.title, new.author, new.isbn, new.call_number);
+    END;
+    CREATE TRIGGER IF NOT EXISTS catalogue_fts_ad AFTER DELETE ON catalogue BEGIN
+        INSERT INTO catalogue_fts(catalogue_fts, rowid, title, author, isbn, call_number)
+        VALUES ('delete', old.rowid, old.title, old.author, old.isbn, old.call_number);
+    END;
+    CREATE TRIGGER IF NOT EXISTS catalogue_fts_au AFTER UPDATE ON catalogue BEGIN
+        INSERT INTO catalogue_fts(catalogue_fts, rowid, title, author, isbn, call_number)
+        VALUES ('delete', old.rowid, old.title, old.author, old.isbn, old.call_number);
+        INSERT INTO catalogue_fts(rowid, title, author, isbn, call_number)
+        VALUES (new.rowid, new.title, new.author, new.isbn, new.call_number);
+    END;
+    INSERT INTO catalogue_fts(catalogue_fts) VALUES ('rebuild');
+    """,
+    # 3: lowercased search_blob shadow column (fields joined by \x1f so matches never span fields),
+    #    letting the substring fallback run one instr() per row instead of four LIKEs.
+    #    The FTS update trigger is narrowed to the indexed columns first, so the backfill leaves catalogue_fts alone
+    """
+    DROP TRIGGER IF EXISTS catalogue_fts_au;
+    CREATE TRIGGER catalogue_fts_au AFTER UPDATE OF title, author, isbn, call_number ON catalogue BEGIN
+        INSERT INTO catalogue_fts(catalogue_fts, rowid, title, author, isbn, call_number)
+        VALUES ('delete', old.rowid, old.title, old.author, old.isbn, old.call_number);
+        INSERT INTO catalogue_fts(rowid, title, author, isbn, call_number)
+        VALUES (new.rowid, new.title, new.author, new.isbn, new.call_number);
+    END;
+    ALTER TABLE catalogue ADD COLUMN search_blob TEXT;
+    UPDATE catalogue SET search_blob = LOWER(
+        COALESCE(title, '') || char(31) || COALESCE(author, '') || char(31) ||
+        COALESCE(isbn, '') || char(31) || COALESCE(call_number, ''));
+    CREATE TRIGGER IF NOT EXISTS catalogue_search_blob_ai AFTER INSERT ON catalogue BEGIN
+        UPDATE catalogue SET search_blob = LOWER(
+            COALESCE(new.title, '') || char(31) || COALESCE(new.author, '') || char(31) ||
+            COALESCE(new.isbn, '') || char(31) || COALESCE(new.call_number, ''))
+        WHERE rowid = new.rowid;
+    END;
+    CREATE TRIGGER IF NOT EXISTS catalogue_search_blob_au
+    AFTER UPDATE OF title, author, isbn, call_number ON catalogue BEGIN
+        UPDATE catalogue SET search_blob = LOWER(
+            COALESCE(new.title, '') || char(31) || COALESCE(new.author, '') || char(31) ||
+            COALESCE(new.isbn, '') || char(31) || COALESCE(new.call_number, ''))
+        WHERE rowid = new.rowid;
+    END;
+    """,
+]
+CATALOGUE_SCHEMA_VERSION = len(CATALOGUE_MIGRATIONS)
+
+# Schema versions at which the optional search structures exist
+FTS_SCHEMA_VERSION = 2
+SEARCH_BLOB_SCHEMA_VERSION = 3
+
+def _split_statements(script: str) -> list:
+    """Split a migration script into complete SQL statements (trigger bodies contain semicolons)."""
+    statements, pending = [], ""
+    for line in script.splitlines(keepends=True):
+        pending += line
+        if sqlite3.complete_statement(pending):
+            statements.append(pending.strip())
+            pending = ""
+    if pending.strip():
+        statements.append(pending.strip())
+    return statements
+
+def apply_catalogue_migrations(conn: sqlite3.Connection) -> int:
+    """
+    Apply pending migrations to an open catalogue.db connection and return the new version.
+    Each step runs in its own BEGIN IMMEDIATE transaction and re-reads user_version under that
+    write lock, so concurrent workers skip steps another process already applied. A failing
+    step is rolled back (earlier steps stay committed) and the error is re-raised so it can be
+    retried later.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for step in range(version, CATALOGUE_SCHEMA_VERSION):
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version <= step:
+                for statement in _split_statements(CATALOGUE_MIGRATIONS[step]):
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {step + 1}")
+                version = step + 1
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+    return max(version, CATALOGUE_SCHEMA_VERSION)
@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the Nandu API server.
+
+Run from the backend directory:
+    gunicorn api_server:app
+
+The app is imported once in the master before workers are forked, with
+NANDU_EAGER_LOAD=1 so nandu_brain loads the SentenceTransformer model and
+both FAISS indexes during that import. Workers inherit the populated caches
+as copy-on-write pages (the mmap'd index files are shared through the page
+cache), so N workers cost roughly one copy of the model and indexes and start
+without reloading them. Request handlers must treat the loader caches
+(_load_faiss_resources.cache, _load_general_faiss_resources.cache) and
+_sentence_transformer_model as read-only.
+"""
+
+import os
+
+os.environ.setdefault("NANDU_EAGER_LOAD", "1")
+
+bind = os.getenv("NANDU_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("NANDU_WORKERS", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
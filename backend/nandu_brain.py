@@ -24,6 +24,7 @@ import logging
 import requests
 import re
 import time
+import threading
 import warnings
 import io
 import contextlib
@@ -31,9 +32,17 @@ from pathlib import Path
 from difflib import get_close_matches
 from dotenv import load_dotenv
 from formatters import format_results
-from collections import defaultdict, Counter
+from catalogue_schema import (
+    CATALOGUE_SCHEMA_VERSION, FTS_SCHEMA_VERSION, SEARCH_BLOB_SCHEMA_VERSION, apply_catalogue_migrations,
+)
+from collections import defaultdict, deque, Counter, OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 import string
-from functools import lru_cache, wraps  # ⚡ Add LRU cache for speed + decorators
+import heapq
+from array import array
+from functools import cache, lru_cache, wraps  # ⚡ Add LRU cache for speed + decorators
+from types import MappingProxyType
 from datetime import datetime
 
 # Reduce noisy logs from third-party libraries early
@@ -47,13 +56,27 @@ warnings.filterwarnings('ignore', category=UserWarning, module='torch')
 
 # For web scraping
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     HAS_BS4 = True
 except ImportError:
     HAS_BS4 = False
     BeautifulSoup = None  # type: ignore
+    SoupStrainer = None  # type: ignore
     logging.warning("BeautifulSoup4 not available - web scraping disabled")
 
+# Prefer the C-based lxml parser when installed (several times faster than html.parser)
+try:
+    import lxml  # noqa: F401 - only used as a BeautifulSoup backend
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only materialize the tags fetch_website_content actually reads
+_WEBSITE_STRAINER = SoupStrainer(['section', 'div', 'a', 'h1', 'h2', 'h3', 'title']) if HAS_BS4 else None
+_WEBSITE_SECTION_CLASS_RE = re.compile(r'content|section|main', re.I)
+# OPAC details pages are scanned for holdings-table rows only
+_OPAC_ROW_STRAINER = SoupStrainer('tr') if HAS_BS4 else None
+
 # Check for requests library
 try:
     # requests already imported at top, just check if it's available
@@ -63,6 +86,24 @@ except ImportError:
     requests = None  # type: ignore
     logging.warning("requests library not available - web scraping disabled")
 
+# Shared HTTP session: keep-alive connection pooling + compressed transfer for website and OPAC fetches
+_http_session = None
+if HAS_REQUESTS:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    _http_session = requests.Session()
+    _http_session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    # Retry only failed connects: a read timeout means the server is slow, and re-sending the
+    # request would multiply the wait of the user request behind it
+    _http_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                max_retries=Retry(total=2, read=0, backoff_factor=0.2))
+    _http_session.mount('https://', _http_adapter)
+    _http_session.mount('http://', _http_adapter)
+
 # Optional: TextBlob for spelling correction
 try:
     from textblob import TextBlob
@@ -70,6 +111,39 @@ try:
 except ImportError:
     HAS_TEXTBLOB = False
     TextBlob = None  # type: ignore
+
+# Optional: pyarrow for memory-mapped FAISS mapping files (falls back to pickle)
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401 - registers pa.ipc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None  # type: ignore
+
+# Optional: pyahocorasick for single-pass multi-keyword matching (falls back to any() scans)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+    ahocorasick = None  # type: ignore
+
+# Optional: orjson for faster audit-log (JSONL) serialization (falls back to json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore
+
+# Optional: rapidfuzz for C++ fuzzy matching of FAQ keys (falls back to difflib)
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+    rf_fuzz = rf_process = None  # type: ignore
     
 
 # Load environment variables from .env file
@@ -128,6 +202,24 @@ def _get_book_search_enabled():
 
 # NANDU_WEBSCRAPE and NANDU_BOOK_SEARCH are now dynamic - call functions directly
 
+# Serve query embeddings from an int8-quantized ONNX Runtime export of the model (opt-in;
+# needs onnxruntime + transformers, and torch for the one-time export)
+USE_ONNX_ENCODER = os.getenv("NANDU_ONNX_ENCODER", "0") == "1"
+
+# OpenMP threads FAISS uses to parallelize batched searches (0 = leave library default).
+# Applies per process: under gunicorn each worker gets this many threads
+FAISS_OMP_THREADS = int(os.getenv("NANDU_FAISS_THREADS", "0"))
+
+# Query-time beam width for HNSW indexes (higher = better recall, slower); ignored for flat indexes
+HNSW_EF_SEARCH = int(os.getenv("NANDU_HNSW_EF_SEARCH", "16"))
+
+# Inverted lists scanned per query for IVF indexes (higher = better recall, slower)
+IVF_NPROBE = int(os.getenv("NANDU_IVF_NPROBE", "8"))
+
+# Load the model and FAISS indexes synchronously during import instead of in a background thread.
+# Set by gunicorn.conf.py (preload_app): the master loads once and forked workers share the pages.
+EAGER_LOAD = os.getenv("NANDU_EAGER_LOAD", "0") == "1"
+
 # -------------------- PERFORMANCE: PRE-LOAD MODELS --------------------
 # Pre-load sentence transformer models for faster first search
 _model_cache = {"semantic_search": None, "tfidf_fallback": None}
@@ -188,9 +280,18 @@ def rate_limit(max_requests=RATE_LIMIT_REQUESTS, window=RATE_LIMIT_WINDOW):
 _error_tracker = {
     "count": 0,
     "last_reset": time.time(),
-    "recent_errors": []
+    "recent_errors": deque(maxlen=10)  # Keeps only the last 10 errors; older ones drop off on append
 }
 
+def _append_jsonl(log_file: Path, entry: dict):
+    """Append one JSON object as a line to log_file (orjson when installed)."""
+    if HAS_ORJSON:
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    else:
+        line = (json.dumps(entry) + "\n").encode("utf-8")
+    with open(log_file, "ab") as f:
+        f.write(line)
+
 def audit_log_query(query: str, response: str, client_ip: str, processing_time: float, success: bool = True):
     """
     Log queries for security audit and analytics (GDPR-compliant).
@@ -217,9 +318,7 @@ def audit_log_query(query: str, response: str, client_ip: str, processing_time:
         log_dir = BASE_DIR / "logs"
         log_dir.mkdir(exist_ok=True)
         
-        audit_file = log_dir / "query_audit.jsonl"
-        with open(audit_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        _append_jsonl(log_dir / "query_audit.jsonl", log_entry)
             
     except Exception as e:
         # Don't fail query if audit logging fails
@@ -250,9 +349,7 @@ def audit_log_admin_activity(activity: str, details: dict, admin_user: str = "ad
         log_dir = BASE_DIR / "logs"
         log_dir.mkdir(exist_ok=True)
         
-        admin_log_file = log_dir / "admin_activity.jsonl"
-        with open(admin_log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        _append_jsonl(log_dir / "admin_activity.jsonl", log_entry)
             
         logger.info(f"Admin activity logged: {activity} by {admin_user}")
             
@@ -276,9 +373,6 @@ def track_error(error: Exception, context: str):
         "timestamp": time.time()
     })
     
-    # Keep only last 10 errors
-    _error_tracker["recent_errors"] = _error_tracker["recent_errors"][-10:]
-    
     # Reset counter every hour
     if time.time() - _error_tracker["last_reset"] > 3600:
         _error_tracker["count"] = 0
@@ -286,7 +380,7 @@ def track_error(error: Exception, context: str):
     
     # Alert if >50 errors/hour (indicates system issue or attack)
     if _error_tracker["count"] > 50:
-        logger.critical(f"🚨 HIGH ERROR RATE: {_error_tracker['count']} errors in last hour. Recent: {_error_tracker['recent_errors'][-3:]}")
+        logger.critical(f"🚨 HIGH ERROR RATE: {_error_tracker['count']} errors in last hour. Recent: {list(_error_tracker['recent_errors'])[-3:]}")
 
 # -------------------- MONITORING: HEALTH CHECK --------------------
 # health_check() function removed - was unused
@@ -299,7 +393,6 @@ BASE_DIR = Path(__file__).parent
 # ========================
 # sanitize_input() function removed - was unused
 
-@lru_cache(maxsize=500)
 def is_valid_query(query: str) -> tuple[bool, str]:
     """
     Validate if query is meaningful or just gibberish
@@ -326,11 +419,19 @@ def is_valid_query(query: str) -> tuple[bool, str]:
     
     # Check for repeated characters (like "aaaaaaa" or "dkdkdkdk")
     if len(query) > 4:
-        # Check for excessive repetition
-        for i in range(len(query) - 3):
-            pattern = query[i:i+2]
-            if query.count(pattern) > len(query) / 4:  # Pattern repeats too much
-                return False, "⚠️ I couldn't understand your query. Please enter a valid question about books, authors, or library services."
+        # Check for excessive repetition: count every bigram (non-overlapping, as str.count
+        # does) in one pass over packed code points instead of rescanning per position
+        codes = [ord(c) for c in query]
+        bigrams = [(codes[i] << 21) | codes[i + 1] for i in range(len(codes) - 1)]
+        counts = {}
+        next_free = {}
+        for i, bigram in enumerate(bigrams):
+            if i >= next_free.get(bigram, 0):
+                counts[bigram] = counts.get(bigram, 0) + 1
+                next_free[bigram] = i + 2
+        threshold = len(query) / 4
+        if any(counts[bigram] > threshold for bigram in bigrams[:len(query) - 3]):  # Pattern repeats too much
+            return False, "⚠️ I couldn't understand your query. Please enter a valid question about books, authors, or library services."
     
     return True, ""
 
@@ -387,120 +488,162 @@ def markdown_to_html(text: str) -> str:
 # -------------------------
 # Utility Functions
 # -------------------------
-def _get_response_prefix(query_lower: str) -> str:
+class _KeywordMatcher:
     """
-    Determine conversational prefix based on query keywords.
-    Enhanced with many more contextual prefixes for better user experience.
+    Substring keyword matching over named pattern groups.
+    With pyahocorasick installed, all groups are found in one automaton pass over the text;
+    otherwise each group falls back to an any(pattern in text) scan.
     """
+
+    def __init__(self, groups: Dict[str, Tuple[str, ...]]):
+        self._groups = groups
+        self._automaton = None
+        if HAS_AHOCORASICK:
+            owners = defaultdict(set)
+            for name, patterns in groups.items():
+                for pattern in patterns:
+                    owners[pattern].add(name)
+            automaton = ahocorasick.Automaton()
+            for pattern, names in owners.items():
+                automaton.add_word(pattern, (pattern, frozenset(names)))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, text: str) -> set:
+        """Return the names of all groups with at least one pattern occurring in text."""
+        if self._automaton is not None:
+            found = set()
+            for _, (_, names) in self._automaton.iter(text):
+                found |= names
+            return found
+        return {name for name, patterns in self._groups.items() if any(p in text for p in patterns)}
+
+    def find(self, text: str) -> Optional[str]:
+        """
+        Return a pattern found in text (any group), or None. The automaton path returns the
+        longest match; the fallback returns the first hit in group order.
+        """
+        if self._automaton is not None:
+            return max((pattern for _, (pattern, _) in self._automaton.iter(text)), key=len, default=None)
+        for patterns in self._groups.values():
+            for pattern in patterns:
+                if pattern in text:
+                    return pattern
+        return None
+
+# Conversational prefixes for _get_response_prefix, checked in order (first matching rule wins)
+_RESPONSE_PREFIX_RULES = (
     # Library Hours & Timing
-    if any(kw in query_lower for kw in ['timing', 'hours', 'open', 'when', 'schedule', 'time']):
-        return "⏰ <strong>Library Hours:</strong><br><br>"
-    
+    (('timing', 'hours', 'open', 'when', 'schedule', 'time'), "⏰ <strong>Library Hours:</strong><br><br>"),
     # Fines & Penalties
-    elif any(kw in query_lower for kw in ['fine', 'penalty', 'fee', 'late', 'overdue', 'charge']):
-        return "💰 <strong>About Fines & Penalties:</strong><br><br>"
-    
+    (('fine', 'penalty', 'fee', 'late', 'overdue', 'charge'), "💰 <strong>About Fines & Penalties:</strong><br><br>"),
     # Borrowing & Circulation
-    elif any(kw in query_lower for kw in ['borrow', 'issue', 'how many', 'limit', 'circulation']):
-        return "📖 <strong>Borrowing Guidelines:</strong><br><br>"
-    
+    (('borrow', 'issue', 'how many', 'limit', 'circulation'), "📖 <strong>Borrowing Guidelines:</strong><br><br>"),
     # Book Search & Catalog
-    elif any(kw in query_lower for kw in ['search', 'find', 'opac', 'catalogue', 'catalog', 'book search']):
-        return "🔍 <strong>Finding Books:</strong><br><br>"
-    
+    (('search', 'find', 'opac', 'catalogue', 'catalog', 'book search'), "🔍 <strong>Finding Books:</strong><br><br>"),
     # Membership & Registration
-    elif any(kw in query_lower for kw in ['membership', 'join', 'register', 'card', 'id card']):
-        return "🎓 <strong>Library Membership:</strong><br><br>"
-    
+    (('membership', 'join', 'register', 'card', 'id card'), "🎓 <strong>Library Membership:</strong><br><br>"),
     # Contact Information
-    elif any(kw in query_lower for kw in ['contact', 'email', 'phone', 'reach', 'address', 'location']):
-        return "📞 <strong>Contact Details:</strong><br><br>"
-    
+    (('contact', 'email', 'phone', 'reach', 'address', 'location'), "📞 <strong>Contact Details:</strong><br><br>"),
     # E-Resources & Digital Services
-    elif any(kw in query_lower for kw in ['e-resource', 'eresource', 'digital', 'online', 'database', 'journal']):
-        return "🌐 <strong>Digital Resources:</strong><br><br>"
-    
+    (('e-resource', 'eresource', 'digital', 'online', 'database', 'journal'), "🌐 <strong>Digital Resources:</strong><br><br>"),
     # Reservation & Holds
-    elif any(kw in query_lower for kw in ['reserve', 'hold', 'book on hold', 'reservation']):
-        return "📋 <strong>Book Reservations:</strong><br><br>"
-    
+    (('reserve', 'hold', 'book on hold', 'reservation'), "📋 <strong>Book Reservations:</strong><br><br>"),
     # Renewal & Extension
-    elif any(kw in query_lower for kw in ['renew', 'extend', 'renewal', 'extension']):
-        return "🔄 <strong>Book Renewals:</strong><br><br>"
-    
+    (('renew', 'extend', 'renewal', 'extension'), "🔄 <strong>Book Renewals:</strong><br><br>"),
     # Return & Drop-off
-    elif any(kw in query_lower for kw in ['return', 'drop', 'give back', 'submit']):
-        return "📤 <strong>Returning Books:</strong><br><br>"
-    
+    (('return', 'drop', 'give back', 'submit'), "📤 <strong>Returning Books:</strong><br><br>"),
     # Services & Facilities
-    elif any(kw in query_lower for kw in ['service', 'facility', 'amenity', 'feature']):
-        return "🏢 <strong>Library Services:</strong><br><br>"
-    
+    (('service', 'facility', 'amenity', 'feature'), "🏢 <strong>Library Services:</strong><br><br>"),
     # Rules & Policies
-    elif any(kw in query_lower for kw in ['rule', 'policy', 'regulation', 'guideline']):
-        return "📋 <strong>Library Policies:</strong><br><br>"
-    
+    (('rule', 'policy', 'regulation', 'guideline'), "📋 <strong>Library Policies:</strong><br><br>"),
     # Help & Support
-    elif any(kw in query_lower for kw in ['help', 'support', 'assistance', 'problem', 'issue']):
-        return "🆘 <strong>Getting Help:</strong><br><br>"
-    
+    (('help', 'support', 'assistance', 'problem', 'issue'), "🆘 <strong>Getting Help:</strong><br><br>"),
     # Technology & Equipment
-    elif any(kw in query_lower for kw in ['computer', 'wifi', 'internet', 'printer', 'scanner', 'technology']):
-        return "💻 <strong>Technology Services:</strong><br><br>"
-    
+    (('computer', 'wifi', 'internet', 'printer', 'scanner', 'technology'), "💻 <strong>Technology Services:</strong><br><br>"),
     # Study Spaces & Environment
-    elif any(kw in query_lower for kw in ['study', 'seat', 'space', 'room', 'quiet', 'environment']):
-        return "📚 <strong>Study Spaces:</strong><br><br>"
-    
+    (('study', 'seat', 'space', 'room', 'quiet', 'environment'), "📚 <strong>Study Spaces:</strong><br><br>"),
     # Research & Academic Support
-    elif any(kw in query_lower for kw in ['research', 'thesis', 'dissertation', 'academic', 'citation']):
-        return "🎓 <strong>Research Support:</strong><br><br>"
-    
+    (('research', 'thesis', 'dissertation', 'academic', 'citation'), "🎓 <strong>Research Support:</strong><br><br>"),
     # Lost & Found
-    elif any(kw in query_lower for kw in ['lost', 'missing', 'damage', 'broken']):
-        return "🔍 <strong>Lost/Damaged Items:</strong><br><br>"
-    
+    (('lost', 'missing', 'damage', 'broken'), "🔍 <strong>Lost/Damaged Items:</strong><br><br>"),
     # Visitors & Guest Access
-    elif any(kw in query_lower for kw in ['visitor', 'guest', 'outside', 'non-student']):
-        return "👥 <strong>Visitor Information:</strong><br><br>"
-    
+    (('visitor', 'guest', 'outside', 'non-student'), "👥 <strong>Visitor Information:</strong><br><br>"),
     # Events & Programs
-    elif any(kw in query_lower for kw in ['event', 'program', 'workshop', 'training']):
-        return "🎪 <strong>Library Events:</strong><br><br>"
-    
+    (('event', 'program', 'workshop', 'training'), "🎪 <strong>Library Events:</strong><br><br>"),
     # Instructions & How-to
-    elif any(kw in query_lower for kw in ['how to', 'how do', 'step', 'instruction', 'guide']):
-        return "📝 <strong>Step-by-Step Guide:</strong><br><br>"
-    
+    (('how to', 'how do', 'step', 'instruction', 'guide'), "📝 <strong>Step-by-Step Guide:</strong><br><br>"),
     # Recommendations & Suggestions
-    elif any(kw in query_lower for kw in ['recommend', 'suggest', 'advice', 'best']):
-        return "💡 <strong>Recommendations:</strong><br><br>"
-    
+    (('recommend', 'suggest', 'advice', 'best'), "💡 <strong>Recommendations:</strong><br><br>"),
     # Statistics & Information
-    elif any(kw in query_lower for kw in ['statistics', 'stat', 'how many', 'number of', 'total']):
-        return "📊 <strong>Library Statistics:</strong><br><br>"
-    
+    (('statistics', 'stat', 'how many', 'number of', 'total'), "📊 <strong>Library Statistics:</strong><br><br>"),
     # Emergency & Urgent
-    elif any(kw in query_lower for kw in ['urgent', 'emergency', 'immediate', 'asap']):
-        return "🚨 <strong>Urgent Information:</strong><br><br>"
-    
+    (('urgent', 'emergency', 'immediate', 'asap'), "🚨 <strong>Urgent Information:</strong><br><br>"),
     # Feedback & Complaints
-    elif any(kw in query_lower for kw in ['feedback', 'complaint', 'suggestion', 'improve']):
-        return "💬 <strong>Your Feedback Matters:</strong><br><br>"
+    (('feedback', 'complaint', 'suggestion', 'improve'), "💬 <strong>Your Feedback Matters:</strong><br><br>"),
+)
+
+_response_prefix_matcher = _KeywordMatcher({prefix: keywords for keywords, prefix in _RESPONSE_PREFIX_RULES})
+
+def _get_response_prefix(query_lower: str) -> str:
+    """
+    Determine conversational prefix based on query keywords.
+    Enhanced with many more contextual prefixes for better user experience.
+    """
+    matched = _response_prefix_matcher.match(query_lower)
+    for _, prefix in _RESPONSE_PREFIX_RULES:
+        if prefix in matched:
+            return prefix
     
     # General Information (Default)
-    else:
-        import random
-        # Randomize the default prefix for variety
-        general_prefixes = [
-            "💡 <strong>Here's what I found:</strong><br><br>",
-            "ℹ️ <strong>Here's the information:</strong><br><br>",
-            "✨ <strong>Let me help you with that:</strong><br><br>",
-            "📚 <strong>Here's what you need to know:</strong><br><br>",
-            "🎯 <strong>Perfect! Here's the answer:</strong><br><br>",
-            "💫 <strong>I've got the details for you:</strong><br><br>"
-        ]
-        return random.choice(general_prefixes)
+    import random
+    # Randomize the default prefix for variety
+    general_prefixes = [
+        "💡 <strong>Here's what I found:</strong><br><br>",
+        "ℹ️ <strong>Here's the information:</strong><br><br>",
+        "✨ <strong>Let me help you with that:</strong><br><br>",
+        "📚 <strong>Here's what you need to know:</strong><br><br>",
+        "🎯 <strong>Perfect! Here's the answer:</strong><br><br>",
+        "💫 <strong>I've got the details for you:</strong><br><br>"
+    ]
+    return random.choice(general_prefixes)
+
+# Patterns that indicate LIBRARY COLLECTION statistics
+_STATISTICS_PATTERNS = (
+    'total books in library', 'number of books in library',
+    'how many books in library', 'how many books does library have',
+    'how many books library have', 'books in library',
+    'library collection', 'collection size', 'total collection',
+    'library has how many', 'size of library'
+)
+
+# Patterns that indicate BORROWING LIMITS (general query, not statistics)
+_BORROWING_PATTERNS = (
+    'students get', 'students borrow', 'students can borrow',
+    'students can get', 'students issue', 'students can issue',
+    'can i borrow', 'can i get', 'can i issue',
+    'allowed to borrow', 'allowed to get', 'borrow limit',
+    'issue limit', 'borrowing limit', 'issuing limit',
+    'ug students', 'pg students', 'phd students',
+    'faculty get', 'staff get', 'professor get'
+)
+
+# Patterns that ask to see more book results
+_SHOW_MORE_PATTERNS = (
+    'show more books', 'more books', 'show more', 'yes show more',
+    'yes, show more', 'see more books', 'view more books',
+    'display more books', 'list more books', 'more results'
+)
+
+_intent_pattern_matcher = _KeywordMatcher({
+    'statistics': _STATISTICS_PATTERNS,
+    'borrowing': _BORROWING_PATTERNS,
+    'show_more': _SHOW_MORE_PATTERNS,
+})
+
+# Accession number lookups: "bc:12345", or a bare number (checked for 4+ digits by the caller)
+_ACCESSION_QUERY_RE = re.compile(r'\bbc:(\d+)\b', re.IGNORECASE)
+_NUMERIC_QUERY_RE = re.compile(r'\s*(\d+)\s*$')
 
 @lru_cache(maxsize=1000)  # ⚡ Cache spelling corrections
 def auto_correct_spelling(query):
@@ -519,11 +662,9 @@ def auto_correct_spelling(query):
         try:
             tokens = set()
             if CATALOGUE_DB.exists():
-                conn = sqlite3.connect(str(CATALOGUE_DB))
-                cur = conn.cursor()
+                cur = _conn().cursor()
                 cur.execute("SELECT DISTINCT author FROM catalogue WHERE author IS NOT NULL")
                 rows = cur.fetchall()
-                conn.close()
                 punct_table = str.maketrans('', '', string.punctuation)
                 for (author,) in rows:
                     if not author:
@@ -587,6 +728,19 @@ def auto_correct_spelling(query):
         logger.warning(f"Spelling correction failed: {e}")
         return query
 
+# In-process mirror of cache/website_cache.json as (mtime, data) to skip re-reading the file
+_website_cache = None
+
+def _read_website_cache(cache_file, mtime):
+    """Return website cache contents, reusing the in-process copy while the file is unchanged."""
+    global _website_cache
+    if _website_cache is not None and _website_cache[0] == mtime:
+        return _website_cache[1]
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _website_cache = (mtime, data)
+    return data
+
 def fetch_website_content(url="https://www.iitrpr.ac.in/library/", cache_timeout=3600):
     """
     Fetch and cache content from the official IIT Ropar library website.
@@ -598,6 +752,7 @@ def fetch_website_content(url="https://www.iitrpr.ac.in/library/", cache_timeout
     Returns:
         dict: Extracted website data including sections, links, and text content
     """
+    global _website_cache
     # Respect runtime setting to avoid network calls unless explicitly enabled
     if not _get_webscrape_enabled():
         logger.info("🌐 Website fetch disabled (NANDU_WEBSCRAPE=0)")
@@ -610,29 +765,30 @@ def fetch_website_content(url="https://www.iitrpr.ac.in/library/", cache_timeout
     cache_file = Path("cache/website_cache.json")
     cache_file.parent.mkdir(exist_ok=True)
     
+    # Single stat() call covers both the existence and the freshness check
+    try:
+        cache_stat = os.stat(cache_file)
+    except FileNotFoundError:
+        cache_stat = None
+
     try:
         # Check if cache exists and is valid
-        if cache_file.exists():
-            # time module already imported at top
-            cache_age = time.time() - cache_file.stat().st_mtime
+        if cache_stat is not None:
+            cache_age = time.time() - cache_stat.st_mtime
             if cache_age < cache_timeout:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    logger.info(f"✅ Using cached website content (age: {cache_age:.0f}s)")
-                    return cached_data
+                cached_data = _read_website_cache(cache_file, cache_stat.st_mtime)
+                logger.info(f"✅ Using cached website content (age: {cache_age:.0f}s)")
+                return cached_data
         
         # Fetch fresh content
         logger.info(f"🌐 Fetching content from {url}")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=5)
+        response = _http_session.get(url, timeout=5)
         response.raise_for_status()
         
         if not HAS_BS4 or BeautifulSoup is None:
             logger.warning("BeautifulSoup4 unavailable after check - skipping website parse")
             return None
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_WEBSITE_STRAINER)
         
         # Extract useful information
         website_data = {
@@ -645,7 +801,7 @@ def fetch_website_content(url="https://www.iitrpr.ac.in/library/", cache_timeout
         }
         
         # Extract main content sections
-        for section in soup.find_all(['section', 'div'], class_=re.compile(r'content|section|main', re.I)):
+        for section in soup.find_all(['section', 'div'], class_=_WEBSITE_SECTION_CLASS_RE):
             section_text = section.get_text(strip=True, separator=' ')
             if section_text and len(section_text) > 50:
                 website_data["text_content"].append(section_text[:500])
@@ -667,7 +823,7 @@ def fetch_website_content(url="https://www.iitrpr.ac.in/library/", cache_timeout
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         phone_pattern = r'\b(?:\+91[-\s]?)?[6-9]\d{9}\b'
         
-        page_text = soup.get_text()
+        page_text = soup.get_text()  # strained tree: no script/style text
         emails = re.findall(email_pattern, page_text)
         phones = re.findall(phone_pattern, page_text)
         
@@ -685,6 +841,7 @@ def fetch_website_content(url="https://www.iitrpr.ac.in/library/", cache_timeout
         # Cache the results
         with open(cache_file, 'w', encoding='utf-8') as f:
             json.dump(website_data, f, indent=2, ensure_ascii=False)
+        _website_cache = (os.stat(cache_file).st_mtime, website_data)
         
         logger.info(f"✅ Fetched and cached website content: {len(website_data['sections'])} sections, {len(website_data['links'])} links")
         return website_data
@@ -692,10 +849,9 @@ def fetch_website_content(url="https://www.iitrpr.ac.in/library/", cache_timeout
     except requests.RequestException as e:
         logger.error(f"❌ Failed to fetch website: {e}")
         # Try to use stale cache if available
-        if cache_file.exists():
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                logger.info("⚠️ Using stale cached data due to fetch error")
-                return json.load(f)
+        if cache_stat is not None:
+            logger.info("⚠️ Using stale cached data due to fetch error")
+            return _read_website_cache(cache_file, cache_stat.st_mtime)
         return None
     except Exception as e:
         logger.error(f"❌ Error processing website content: {e}")
@@ -764,6 +920,57 @@ def search_website_content(query, website_data):
     
     return None
 
+# Serializes read-modify-write of cache/opac_cache.json between concurrent OPAC checks
+_opac_cache_lock = threading.Lock()
+
+# Parsed opac_cache.json, reused until the file changes on disk (other workers also write it)
+_opac_cache_memo = {"key": None, "data": {}}
+
+def _read_opac_cache(cache_file: Path) -> dict:
+    """Return the OPAC cache contents, re-parsing the file only when its mtime/size changed.
+    Callers must hold _opac_cache_lock."""
+    try:
+        st = cache_file.stat()
+    except FileNotFoundError:
+        return {}
+    key = (str(cache_file.resolve()), st.st_mtime_ns, st.st_size)
+    if _opac_cache_memo["key"] != key:
+        raw = cache_file.read_bytes()
+        _opac_cache_memo["data"] = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        _opac_cache_memo["key"] = key
+    return _opac_cache_memo["data"]
+
+def _write_opac_cache(cache_file: Path, cache_data: dict):
+    """Write the OPAC cache file and remember it as the current parsed copy. Callers must hold _opac_cache_lock."""
+    if HAS_ORJSON:
+        cache_file.write_bytes(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f, indent=2)
+    st = cache_file.stat()
+    _opac_cache_memo["key"] = (str(cache_file.resolve()), st.st_mtime_ns, st.st_size)
+    _opac_cache_memo["data"] = cache_data
+
+# OPAC search-results page patterns, compiled once
+_OPAC_RESULTS_RE = re.compile(r'(\d+)\s+results?\s+found', re.IGNORECASE)
+_OPAC_FOUND_RE = re.compile(r'found', re.IGNORECASE)
+_OPAC_RECORD_CLASS_RE = re.compile(r'result', re.I)
+_OPAC_TITLE_HREF_RE = re.compile(r'biblio|detail', re.I)
+_OPAC_ITEM_RES = (
+    # "Barcode: XXXX Status: Available/Checked out Due: Date"
+    re.compile(r'(?:Barcode|Accession):\s*([^\s]+).*?Status:\s*([^,\n]+)(?:.*?Due:\s*([^\n,]+))?', re.IGNORECASE),
+    re.compile(r'([0-9]+)\s*-\s*(Available|Checked out|Issued)(?:\s*-\s*Due:\s*([^\n,]+))?', re.IGNORECASE),
+    re.compile(r'Accession\s*#?\s*([0-9]+).*?(Available|Checked out|Issued)(?:.*?Due:\s*([^\n,]+))?', re.IGNORECASE),
+)
+_OPAC_AVAILABLE_RE = re.compile(r'Items available for loan:[^)]*\((\d+)\)')
+_OPAC_ISSUED_RE = re.compile(r'Checked out\((\d+)\)')
+
+# Item statuses listed in the holdings table of an OPAC details page
+_OPAC_ITEM_STATUSES = frozenset(('Available', 'Checked out', 'In transit', 'On hold'))
+# Lowercased search-result item statuses counted as available / issued copies
+_OPAC_AVAILABLE_STATUSES = frozenset(('available', 'on shelf'))
+_OPAC_ISSUED_STATUSES = frozenset(('checked out', 'issued'))
+
 def check_book_availability_opac(title="", author="", isbn="", accession_numbers=None, cache_timeout=300, force_refresh=False):
     """
     Check book availability from IIT Ropar OPAC (Online Public Access Catalog).
@@ -798,15 +1005,13 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
     try:
         # Check cache first (unless force_refresh)
         if not force_refresh:
-            if cache_file.exists():
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    if cache_key in cache_data:
-                        cached_entry = cache_data[cache_key]
-                        cache_time = cached_entry.get('cached_at', 0)
-                        if time.time() - cache_time < cache_timeout:
-                            logger.debug(f"⚡ Using cached OPAC data (age: {int(time.time() - cache_time)}s)")
-                            return cached_entry.get('data')
+            with _opac_cache_lock:
+                cached_entry = _read_opac_cache(cache_file).get(cache_key)
+            if cached_entry:
+                cache_time = cached_entry.get('cached_at', 0)
+                if time.time() - cache_time < cache_timeout:
+                    logger.debug(f"⚡ Using cached OPAC data (age: {int(time.time() - cache_time)}s)")
+                    return cached_entry.get('data')
         
         logger.info(f"🌐 Fetching fresh availability data from OPAC")
         
@@ -846,15 +1051,11 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
         params = {"q": search_query}
         
         logger.info(f"🔍 Searching OPAC for: {search_query}")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
         
-        response = requests.get(search_url, params=params, headers=headers, timeout=10)
+        # Shared session: reuses the pooled keep-alive connection to the OPAC host
+        response = _http_session.get(search_url, params=params, timeout=(3, 10))  # (connect, read)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
         # Extract availability information
         availability_info = {
             "query": search_query,
@@ -867,7 +1068,8 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
         
         # Check if this is a book details page (redirected from bc: search)
         if 'opac-detail.pl' in response.url:
-            # Parse book details page
+            # Parse book details page: only table rows are read, so only they are built into the tree
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_OPAC_ROW_STRAINER)
             availability_info["total_results"] = 1  # One book found
             
             # Look for item table rows
@@ -875,13 +1077,13 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
             for row in table_rows:
                 cells = row.find_all(['td', 'th'])
                 if len(cells) >= 6:  # Table has 7 columns, we need at least status column
-                    row_text = [cell.get_text(strip=True) for cell in cells]
-                    
                     # Status is typically in column 3 (0-indexed: 0=type, 1=library, 2=call#, 3=status, 4=date_due, 5=barcode)
-                    status_cell = row_text[3] if len(row_text) > 3 else ""
+                    status_cell = cells[3].get_text(strip=True)
                     
-                    # Check if this is a data row (not header) and has status info
-                    if status_cell and status_cell in ['Available', 'Checked out', 'In transit', 'On hold']:
+                    # Check if this is a data row (not header) and has status info;
+                    # only item rows pay for extracting the remaining cells' text
+                    if status_cell in _OPAC_ITEM_STATUSES:
+                        row_text = [cell.get_text(strip=True) for cell in cells]
                         availability_info["total_copies"] += 1
                         
                         if status_cell == 'Available':
@@ -898,22 +1100,29 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
                             "due_date": row_text[4] if len(row_text) > 4 else ""
                         }
                         availability_info["details"].append(book_info)
+        elif not _OPAC_RECORD_CLASS_RE.search(response.text):
+            # Neither a result count nor result record divs can exist without "result" in the
+            # page: skip building the BeautifulSoup tree entirely (nothing found)
+            logger.debug("OPAC search page has no result markup, skipping HTML parse")
         else:
             # Parse search results page (original logic)
-            # Look for result count
-            result_text = soup.get_text()
-            match = re.search(r'(\d+)\s+results?\s+found', result_text, re.IGNORECASE)
-            if match:
-                availability_info["total_results"] = int(match.group(1))
+            soup = BeautifulSoup(response.content, HTML_PARSER)
+            # Look for result count. Building the page's full text is only worth it when the
+            # raw HTML mentions "found" at all (a C-level scan of the string already in memory)
+            if _OPAC_FOUND_RE.search(response.text):
+                match = _OPAC_RESULTS_RE.search(soup.get_text())
+                if match:
+                    availability_info["total_results"] = int(match.group(1))
             
             # Look for individual book records
-            book_records = soup.find_all('div', class_=re.compile(r'result', re.I))
+            # Check first 10 results: limit stops the tree walk once they are found
+            book_records = soup.find_all('div', class_=_OPAC_RECORD_CLASS_RE, limit=10)
             
-            for record in book_records[:10]:  # Check first 10 results
+            for record in book_records:
                 book_info = {}
                 
                 # Extract title - look for links or headings
-                title_elem = record.find(['a', 'h3', 'h4'], href=re.compile(r'biblio|detail', re.I))
+                title_elem = record.find(['a', 'h3', 'h4'], href=_OPAC_TITLE_HREF_RE)
                 if not title_elem:
                     title_elem = record.find(['a', 'h3', 'h4'])
                 if title_elem:
@@ -926,16 +1135,9 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
                 book_info["items"] = []
                 
                 # Look for item details in various formats
-                # Pattern 1: "Barcode: XXXX Status: Available/Checked out Due: Date"
-                item_patterns = [
-                    r'(?:Barcode|Accession):\s*([^\s]+).*?Status:\s*([^,\n]+)(?:.*?Due:\s*([^\n,]+))?',
-                    r'([0-9]+)\s*-\s*(Available|Checked out|Issued)(?:\s*-\s*Due:\s*([^\n,]+))?',
-                    r'Accession\s*#?\s*([0-9]+).*?(Available|Checked out|Issued)(?:.*?Due:\s*([^\n,]+))?'
-                ]
-                
                 items_found = False
-                for pattern in item_patterns:
-                    matches = re.findall(pattern, record_text, re.IGNORECASE)
+                for pattern in _OPAC_ITEM_RES:
+                    matches = pattern.findall(record_text)
                     for match in matches:
                         accession = match[0].strip()
                         status = match[1].strip()
@@ -954,12 +1156,12 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
                     issued_count = 0
                     
                     # Parse "Items available for loan:Nalanda Library(X)" pattern
-                    available_match = re.search(r'Items available for loan:[^)]*\((\d+)\)', record_text)
+                    available_match = _OPAC_AVAILABLE_RE.search(record_text)
                     if available_match:
                         available_count = int(available_match.group(1))
                     
                     # Parse "Not available:Nalanda Library: Checked out(X)" pattern
-                    issued_match = re.search(r'Checked out\((\d+)\)', record_text)
+                    issued_match = _OPAC_ISSUED_RE.search(record_text)
                     if issued_match:
                         issued_count = int(issued_match.group(1))
                     
@@ -978,9 +1180,14 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
                             "due_date": ""
                         })
                 
-                # Count totals from parsed items
-                available_count = sum(1 for item in book_info["items"] if item["status"].lower() in ["available", "on shelf"])
-                issued_count = sum(1 for item in book_info["items"] if item["status"].lower() in ["checked out", "issued"])
+                # Count totals from parsed items (one pass over the items for both counts)
+                available_count = issued_count = 0
+                for item in book_info["items"]:
+                    status_lower = item["status"].lower()
+                    if status_lower in _OPAC_AVAILABLE_STATUSES:
+                        available_count += 1
+                    elif status_lower in _OPAC_ISSUED_STATUSES:
+                        issued_count += 1
                 
                 # Update availability info
                 availability_info["available_copies"] += available_count
@@ -1009,18 +1216,16 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
         
         # Cache the result for faster subsequent queries
         try:
-            cache_data = {}
-            if cache_file.exists():
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-            
-            cache_data[cache_key] = {
-                'data': availability_info,
-                'cached_at': time.time()
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            with _opac_cache_lock:
+                # Copy so a failed write never leaves the in-memory copy ahead of the file
+                cache_data = dict(_read_opac_cache(cache_file))
+                
+                cache_data[cache_key] = {
+                    'data': availability_info,
+                    'cached_at': time.time()
+                }
+                
+                _write_opac_cache(cache_file, cache_data)
             logger.debug(f"💾 Cached OPAC result for {cache_key}")
         except Exception as cache_error:
             logger.warning(f"Failed to cache OPAC result: {cache_error}")
@@ -1032,7 +1237,126 @@ def check_book_availability_opac(title="", author="", isbn="", accession_numbers
         logger.error(f"❌ OPAC check failed: {e}")
         return None
 
-@lru_cache(maxsize=500)
+# Greeting detection (classify_query, short queries only)
+_GREETING_RES = tuple(re.compile(p) for p in (
+    # Common greetings
+    r'\b(hi|hello|hey|greetings|good morning|good afternoon|good evening)\b',
+    # Conversational queries
+    r'\b(how are you|how r u|how do you do|whats up|what\'s up|wassup)\b',
+    r'\b(how is it going|hows it going)\b',
+    # Casual
+    r'\b(yo|sup|hiya|howdy)\b',
+    # Polite
+    r'\b(namaste|namaskar)\b',
+))
+
+# Procedural "how to" queries (classify_query, checked before book keywords)
+_PROCEDURAL_RES = tuple(re.compile(p) for p in (
+    # Specific library procedures
+    r"\bhow (to|do i|can i)\s+(reserve|book|issue|borrow|return|renew)\b",
+    r"\bhow (to|do i|can i)\s+(get|obtain|access|find)\s+books?\b",
+    r"\bprocess (of|to|for)\s+(reserving|booking|issuing|borrowing)\b",
+    r"\bsteps? (to|for)\s+(reserve|book|issue|borrow|return|renew)\b",
+    r"\b(reservation|booking|issuing|borrowing|returning)\s+(process|procedure|method)\b",
+    r"\bhow (to|do i)\s+(place|make)\s+(reservation|booking)\b",
+    # General "how to" with book/books - these are procedural questions about library processes
+    r"\bhow (to|do i|can i)\s+\w+\s+(book|books)\b",  # "how to hold a book", "how to care for books", etc.
+    r"\bhow (to|do i|can i)\s+\w+\s+\w+\s+(book|books)\b",  # "how to properly handle a book", etc.
+    # Questions about book handling, care, usage
+    r"\bhow (to|do i)\s+(handle|hold|care|treat|protect|maintain)\b.*\b(book|books)\b",
+    r"\b(what|how)\s+(is|are)\s+the\s+(way|ways|method|methods|process|procedure)\b.*\b(book|books)\b"
+))
+
+# Instructional 'how to search/find' queries (classify_query)
+_INSTRUCTIONAL_RES = tuple(re.compile(p) for p in (
+    r"\bhow (to|do i|can i)\s+(search|find)\b",
+    r"\bhow to use (opac|catalogue|catalog)\b",
+    r"\bhow do i use (opac|catalogue|catalog)\b",
+    r"\bguide\b.*\b(search|find)\b",
+))
+
+# Subject/topic patterns that suggest a book search (classify_query)
+_SUBJECT_RES = tuple(re.compile(p) for p in (
+    r'\b(physics|chemistry|biology|mathematics|math)\b',
+    r'\b(computer|programming|coding|algorithm|data)\b',
+    r'\b(engineering|mechanical|electrical|civil)\b',
+    r'\b(history|geography|economics|sociology)\b',
+    r'\b(novel|fiction|literature|poetry|drama)\b',
+    r'\b(psychology|philosophy|anthropology)\b'
+))
+
+# ISBN-10/13 in a query
+_ISBN_QUERY_RE = re.compile(r'\b(?:\d{9}[\dX]|\d{13})\b')
+
+# Exclusion patterns - these queries should NOT be classified as book searches (classify_query)
+_EXCLUSION_PATTERNS = (
+    # Personal belongings and entry procedures
+    'make entry', 'entry of', 'bring my', 'my books and laptop', 'personal books',
+    'own books', 'entry portal', 'entry exit',
+    
+    # Library rules and procedures
+    'do i have to', 'should i', 'can i bring', 'allowed to bring',
+    'entry register', 'register entry',
+    
+    # Library services and policies
+    'library rule', 'library policy', 'library service', 'library procedure',
+    'fine policy', 'membership', 'card required', 'id card',
+    
+    # Vacation and borrowing policies
+    'books for vacation', 'vacation books', 'books for summer', 'books for winter',
+    'can i get books for', 'vacation period', 'holiday books', 'semester break',
+    
+    # Borrowing policy questions
+    'can i issue', 'can i borrow', 'how many books can i', 'book limit',
+    'borrowing limit', 'issue limit', 'renewal policy', 'due date',
+    
+    # Book renewal questions
+    'can i renew', 'renew my books', 'book renewal', 'renewal of books',
+    'extend books', 'extension of books',
+    
+    # Common area booking
+    'can i book', 'book a common', 'common sphere', 'sphere area',
+    'book common area', 'reserve area', 'area booking',
+    
+    # Damaged/defective book issues
+    'book is damaged', 'damaged book', 'book damaged', 'defective book',
+    'torn book', 'missing pages', 'book condition', 'want to issue but',
+    'issue but damaged', 'issue but torn', 'book but damaged',
+    'issue a book but', 'but it\'s damaged', 'but damaged',
+    
+    # Return and card issues
+    'return book without', 'without a card', 'somebody else\'s card',
+    'without card', 'return without card', 'else\'s card',
+    
+    # Renewal policies and procedures
+    'renew without bringing', 'renew a book without', 'how many times',
+    'times can renew', 'times i can renew', 'renew how many',
+    
+    # Library recall and policies
+    'library recall', 'can library recall', 'recall the book',
+    'library can recall', 'book that i have issued',
+    
+    # Location and directions
+    'where are', 'where is', 'location of', 'fiction books in',
+    'books in the library', 'where can i find',
+    
+    # Techno booth and facility booking
+    'techno booth', 'book techno booth', 'strength required',
+    'min and max strength', 'booth booking', 'facility booking',
+    
+    # Book bank and special services
+    'book bank book', 'what is book bank', 'book bank service',
+    'bank book is', 'book bank policy',
+    
+    # General library questions
+    'how to', 'what to do', 'where to', 'when to', 'why to'
+)
+
+# Longest first, so the pure-Python fallback also logs the most specific phrase that matched
+# (e.g. not just 'how to'), as the automaton path does
+_exclusion_matcher = _KeywordMatcher({'exclusion': tuple(sorted(_EXCLUSION_PATTERNS, key=len, reverse=True))})
+
+@lru_cache(maxsize=4096)  # ⚡ Deterministic per query text; raw variants that clean to the same text share it
 def classify_query(query):
     """
     Classify user query into categories: 'book', 'general', or 'greeting'.
@@ -1044,50 +1368,21 @@ def classify_query(query):
     query_lower = query.lower().strip()
     
     # ===== GREETING DETECTION (PRIORITY 1) =====
-    greeting_patterns = [
-        # Common greetings
-        r'\b(hi|hello|hey|greetings|good morning|good afternoon|good evening)\b',
-        # Conversational queries
-        r'\b(how are you|how r u|how do you do|whats up|what\'s up|wassup)\b',
-        r'\b(how is it going|hows it going)\b',
-        # Casual
-        r'\b(yo|sup|hiya|howdy)\b',
-        # Polite
-        r'\b(namaste|namaskar)\b',
-    ]
-    
     # Check if it's just a greeting (short query with greeting words)
     if len(query_lower.split()) <= 6:  # Short queries likely to be greetings
-        for pattern in greeting_patterns:
-            if re.search(pattern, query_lower):
+        for pattern in _GREETING_RES:
+            if pattern.search(query_lower):
                 logger.info(f"👋 Fallback: GREETING detected")
                 return 'greeting'
     
     # ISBN pattern
-    if re.search(r'\b(?:\d{9}[\dX]|\d{13})\b', query_lower):
+    if _ISBN_QUERY_RE.search(query_lower):
         logger.info(f"📚 Fallback: BOOK (ISBN)")
         return 'book'
     
-    # Priority check for procedural "how to" queries (must be checked FIRST)
-    procedural_patterns = [
-        # Specific library procedures
-        r"\bhow (to|do i|can i)\s+(reserve|book|issue|borrow|return|renew)\b",
-        r"\bhow (to|do i|can i)\s+(get|obtain|access|find)\s+books?\b",
-        r"\bprocess (of|to|for)\s+(reserving|booking|issuing|borrowing)\b",
-        r"\bsteps? (to|for)\s+(reserve|book|issue|borrow|return|renew)\b",
-        r"\b(reservation|booking|issuing|borrowing|returning)\s+(process|procedure|method)\b",
-        r"\bhow (to|do i)\s+(place|make)\s+(reservation|booking)\b",
-        # General "how to" with book/books - these are procedural questions about library processes
-        r"\bhow (to|do i|can i)\s+\w+\s+(book|books)\b",  # "how to hold a book", "how to care for books", etc.
-        r"\bhow (to|do i|can i)\s+\w+\s+\w+\s+(book|books)\b",  # "how to properly handle a book", etc.
-        # Questions about book handling, care, usage
-        r"\bhow (to|do i)\s+(handle|hold|care|treat|protect|maintain)\b.*\b(book|books)\b",
-        r"\b(what|how)\s+(is|are)\s+the\s+(way|ways|method|methods|process|procedure)\b.*\b(book|books)\b"
-    ]
-    
-    # Check for procedural queries first (before book keywords)
-    for pattern in procedural_patterns:
-        if re.search(pattern, query_lower):
+    # Priority check for procedural "how to" queries (must be checked FIRST, before book keywords)
+    for pattern in _PROCEDURAL_RES:
+        if pattern.search(query_lower):
             logger.info(f"📋 Fallback: GENERAL (procedural 'how to' query)")
             return 'general'
 
@@ -1130,13 +1425,7 @@ def classify_query(query):
         return 'general'
     
     # Instructional 'how to search/find' queries should be GENERAL (give guidance, not book results)
-    instructional_patterns = [
-        r"\bhow (to|do i|can i)\s+(search|find)\b",
-        r"\bhow to use (opac|catalogue|catalog)\b",
-        r"\bhow do i use (opac|catalogue|catalog)\b",
-        r"\bguide\b.*\b(search|find)\b",
-    ]
-    if any(re.search(p, query_lower) for p in instructional_patterns):
+    if any(p.search(query_lower) for p in _INSTRUCTIONAL_RES):
         logger.info("📋 Fallback: GENERAL (instructional search guidance)")
         return 'general'
     
@@ -1175,76 +1464,13 @@ def classify_query(query):
         'dewey decimal classification', 'cataloging rules'
     ]
     
-    # Exclusion patterns - these queries should NOT be classified as book searches
-    exclusion_patterns = [
-        # Personal belongings and entry procedures
-        'make entry', 'entry of', 'bring my', 'my books and laptop', 'personal books',
-        'own books', 'entry portal', 'entry exit',
-        
-        # Library rules and procedures
-        'do i have to', 'should i', 'can i bring', 'allowed to bring',
-        'entry register', 'register entry',
-        
-        # Library services and policies
-        'library rule', 'library policy', 'library service', 'library procedure',
-        'fine policy', 'membership', 'card required', 'id card',
-        
-        # Vacation and borrowing policies
-        'books for vacation', 'vacation books', 'books for summer', 'books for winter',
-        'can i get books for', 'vacation period', 'holiday books', 'semester break',
-        
-        # Borrowing policy questions
-        'can i issue', 'can i borrow', 'how many books can i', 'book limit',
-        'borrowing limit', 'issue limit', 'renewal policy', 'due date',
-        
-        # Book renewal questions
-        'can i renew', 'renew my books', 'book renewal', 'renewal of books',
-        'extend books', 'extension of books',
-        
-        # Common area booking
-        'can i book', 'book a common', 'common sphere', 'sphere area',
-        'book common area', 'reserve area', 'area booking',
-        
-        # Damaged/defective book issues
-        'book is damaged', 'damaged book', 'book damaged', 'defective book',
-        'torn book', 'missing pages', 'book condition', 'want to issue but',
-        'issue but damaged', 'issue but torn', 'book but damaged',
-        'issue a book but', 'but it\'s damaged', 'but damaged',
-        
-        # Return and card issues
-        'return book without', 'without a card', 'somebody else\'s card',
-        'without card', 'return without card', 'else\'s card',
-        
-        # Renewal policies and procedures
-        'renew without bringing', 'renew a book without', 'how many times',
-        'times can renew', 'times i can renew', 'renew how many',
-        
-        # Library recall and policies
-        'library recall', 'can library recall', 'recall the book',
-        'library can recall', 'book that i have issued',
-        
-        # Location and directions
-        'where are', 'where is', 'location of', 'fiction books in',
-        'books in the library', 'where can i find',
-        
-        # Techno booth and facility booking
-        'techno booth', 'book techno booth', 'strength required',
-        'min and max strength', 'booth booking', 'facility booking',
-        
-        # Book bank and special services
-        'book bank book', 'what is book bank', 'book bank service',
-        'bank book is', 'book bank policy',
-        
-        # General library questions
-        'how to', 'what to do', 'where to', 'when to', 'why to'
-    ]
     
-    # Check if query matches exclusion patterns (should NOT be book search)
-    for pattern in exclusion_patterns:
-        if pattern in query_lower:
-            logger.info(f"🚫 Query excluded from book search (pattern: '{pattern}')")
-            # Return early - skip ALL book classification logic
-            return 'general'
+    # Check if query matches exclusion patterns (should NOT be book search), all in one pass
+    pattern = _exclusion_matcher.find(query_lower)
+    if pattern is not None:
+        logger.info(f"🚫 Query excluded from book search (pattern: '{pattern}')")
+        # Return early - skip ALL book classification logic
+        return 'general'
     
     # Only check book keywords if not excluded above
     for keyword in book_keywords:
@@ -1267,17 +1493,8 @@ def classify_query(query):
     
     # Check for subject/topic patterns (likely book searches)
     # e.g., "machine learning", "organic chemistry", "data structures"
-    subject_patterns = [
-        r'\b(physics|chemistry|biology|mathematics|math)\b',
-        r'\b(computer|programming|coding|algorithm|data)\b',
-        r'\b(engineering|mechanical|electrical|civil)\b',
-        r'\b(history|geography|economics|sociology)\b',
-        r'\b(novel|fiction|literature|poetry|drama)\b',
-        r'\b(psychology|philosophy|anthropology)\b'
-    ]
-    
-    for pattern in subject_patterns:
-        if re.search(pattern, query_lower):
+    for pattern in _SUBJECT_RES:
+        if pattern.search(query_lower):
             logger.info(f"📚 Fallback classified '{query}' as BOOK QUERY (subject pattern matched)")
             return 'book'
     
@@ -1291,6 +1508,79 @@ def classify_query(query):
     logger.info(f"📋 Fallback classified '{query}' as GENERAL QUERY (default)")
     return 'general'
 
+@lru_cache(maxsize=2048)  # ⚡ One cache entry per raw query for the whole validate/clean/classify pipeline
+def validate_and_classify(raw_query: str) -> tuple[bool, str, str, str]:
+    """
+    Validate, clean and classify a user query in a single cached step.
+
+    Args:
+        raw_query: Stripped user query
+
+    Returns:
+        (is_valid, error_message, cleaned_query, query_type) tuple;
+        cleaned_query and query_type are empty strings for invalid queries
+    """
+    is_valid, error_msg = is_valid_query(raw_query)
+    if not is_valid:
+        return False, error_msg, "", ""
+
+    # Remove extra punctuation before classification
+    cleaned_query = re.sub(r'[^\w\s]', '', raw_query).strip()
+    return True, "", cleaned_query, classify_query(cleaned_query)
+
+# Punctuation tables used for grouping keys (built once)
+_TITLE_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_AUTHOR_PUNCT_TABLE = str.maketrans('', '', string.punctuation.replace("'", ""))
+
+@cache  # ⚡ Catalogue titles repeat across copies; normalize each once per process
+def normalize_title(s: str) -> str:
+    s = (s or "").strip().lower()
+    # remove extra spaces and basic punctuation
+    s = s.translate(_TITLE_PUNCT_TABLE)
+    s = ' '.join(s.split())
+    return s
+
+@cache  # ⚡ Authors form a bounded vocabulary; compute each key once per process
+def canonical_author_key(author_raw: str) -> str:
+    """Create an author key like 'lastname|firstinitial'. If not parseable, fall back to normalized string.
+    Handles forms: 'First Last', 'Last, First', 'C. Last', 'Last, C.' and ignores extra middle names.
+    For multiple authors separated by '|' or ';', use the first author only for grouping.
+    """
+    a = (author_raw or "").strip()
+    if not a:
+        return ""
+    # pick primary author if multiple
+    primary = a.split('|')[0].split(';')[0].strip()
+
+    # Normalize whitespace and punctuation
+    p = primary.translate(_AUTHOR_PUNCT_TABLE)
+    parts = [t for t in p.split() if t]
+    if not parts:
+        return ""
+
+    # Try "Last, First" format
+    if ',' in primary:
+        last = primary.split(',')[0].strip().lower()
+        after = primary.split(',')[1].strip()
+        first_initial = after[0].lower() if after else ''
+        return f"{last}|{first_initial}"
+
+    # Else assume "First Middle Last" or initials then last
+    last = parts[-1].lower()
+    first = parts[0]
+    first_initial = first[0].lower() if first else ''
+    return f"{last}|{first_initial}"
+
+# merge_duplicates keeps at most this many editions per book (sorted by publisher, year)
+MAX_EDITIONS_PER_BOOK = 20
+
+def _most_common_value(counter: Counter):
+    """Most frequent value; ties go to the smallest value so the choice is deterministic."""
+    return min(counter.items(), key=lambda kv: (-kv[1], kv[0]))[0]
+
+# Publisher/Year placeholder values (pandas NaN exports, missing cells) treated as empty
+_NAN_SENT = frozenset((None, 'nan', 'NaN', ''))
+
 def merge_duplicates(results):
     """
     Merge book records strictly when they refer to the exact same book per rules:
@@ -1308,47 +1598,6 @@ def merge_duplicates(results):
         logger.debug("No results to merge")
         return []
 
-    # string and collections modules already imported at top
-
-    def normalize_title(s: str) -> str:
-        s = (s or "").strip().lower()
-        # remove extra spaces and basic punctuation
-        table = str.maketrans('', '', string.punctuation)
-        s = s.translate(table)
-        s = ' '.join(s.split())
-        return s
-
-    def canonical_author_key(author_raw: str) -> str:
-        """Create an author key like 'lastname|firstinitial'. If not parseable, fall back to normalized string.
-        Handles forms: 'First Last', 'Last, First', 'C. Last', 'Last, C.' and ignores extra middle names.
-        For multiple authors separated by '|' or ';', use the first author only for grouping.
-        """
-        a = (author_raw or "").strip()
-        if not a:
-            return ""
-        # pick primary author if multiple
-        primary = a.split('|')[0].split(';')[0].strip()
-
-        # Normalize whitespace and punctuation
-        table = str.maketrans('', '', string.punctuation.replace("'", ""))
-        p = primary.translate(table)
-        parts = [t for t in p.split() if t]
-        if not parts:
-            return ""
-
-        # Try "Last, First" format
-        if ',' in primary:
-            last = primary.split(',')[0].strip().lower()
-            after = primary.split(',')[1].strip()
-            first_initial = after[0].lower() if after else ''
-            return f"{last}|{first_initial}"
-
-        # Else assume "First Middle Last" or initials then last
-        last = parts[-1].lower()
-        first = parts[0]
-        first_initial = first[0].lower() if first else ''
-        return f"{last}|{first_initial}"
-
     groups: dict[tuple[str, str], dict] = {}
     editions_map: dict[tuple[str, str], set[tuple]] = defaultdict(set)
 
@@ -1405,58 +1654,145 @@ def merge_duplicates(results):
 
     # Finalize editions and choose representative Publisher/Year (most common)
     for key, book in groups.items():
-        eds = [
-            {"Publisher": pub if pub not in (None, 'nan', 'NaN') else "",
-             "Year": yr if yr not in (None, 'nan', 'NaN') else ""}
-            for (pub, yr) in sorted(editions_map.get(key, set()))
+        editions = editions_map.get(key, ())
+        # Long edition histories only need the first K: O(N log K) heap selection instead of a full sort
+        if len(editions) > 2 * MAX_EDITIONS_PER_BOOK:
+            shown = heapq.nsmallest(MAX_EDITIONS_PER_BOOK, editions)
+        else:
+            shown = sorted(editions)[:MAX_EDITIONS_PER_BOOK]
+        book["editions"] = [
+            {"Publisher": pub if pub not in _NAN_SENT else "", "Year": yr if yr not in _NAN_SENT else ""}
+            for (pub, yr) in shown
         ]
-        book["editions"] = eds
 
-        # Choose most common non-empty Publisher/Year for top-level fields
-        pub_counter = Counter([e["Publisher"] for e in eds if e["Publisher"]])
-        yr_counter = Counter([e["Year"] for e in eds if e["Year"]])
+        # Choose most common non-empty Publisher/Year (over all editions) for top-level fields
+        pub_counter = Counter(pub for pub, _ in editions if pub not in _NAN_SENT)
+        yr_counter = Counter(yr for _, yr in editions if yr not in _NAN_SENT)
         if pub_counter:
-            book["Publisher"] = pub_counter.most_common(1)[0][0]
+            book["Publisher"] = _most_common_value(pub_counter)
         if yr_counter:
-            book["Year"] = yr_counter.most_common(1)[0][0]
+            book["Year"] = _most_common_value(yr_counter)
 
     logger.info(f"Merged {len(results)} records into {len(groups)} unique entries (title+author strict)")
     return list(groups.values())
 
+# -------------------------
+# Catalogue Database Helpers
+# -------------------------
+_catalogue_schema_checked = False
+_catalogue_schema_version = 0  # PRAGMA user_version reached by catalogue.db (see catalogue_schema.py)
+_catalogue_schema_lock = threading.Lock()
+
+# Columns returned to callers (excludes internal shadow columns such as search_blob)
+_CATALOGUE_COLUMNS = "c.id, c.call_number, c.isbn, c.title, c.subtitle, c.author, c.pages, c.publisher, c.year, c.accession_number"
+
+def _ensure_catalogue_schema():
+    """
+    Apply pending catalogue.db migrations (indexes, FTS5 table, search_blob) once per process,
+    and again whenever _conn() sees that catalogue.db was replaced or rewritten.
+    Failures (e.g. read-only database, SQLite without FTS5) are logged and searches
+    fall back to plain LIKE scans.
+    """
+    global _catalogue_schema_checked, _catalogue_schema_version
+    if _catalogue_schema_checked:
+        return
+    with _catalogue_schema_lock:
+        if _catalogue_schema_checked:
+            return
+        try:
+            # Generous busy timeout: other workers may hold the write lock while migrating
+            with contextlib.closing(sqlite3.connect(CATALOGUE_DB, timeout=60)) as conn:
+                _catalogue_schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if _catalogue_schema_version < CATALOGUE_SCHEMA_VERSION:
+                    start = time.time()
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    try:
+                        apply_catalogue_migrations(conn)
+                    finally:
+                        # A failed step leaves the database (and searches) at the last completed version
+                        _catalogue_schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+                    logger.info(f"✅ Catalogue schema migrated to v{CATALOGUE_SCHEMA_VERSION} in {time.time() - start:.2f}s")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not migrate catalogue schema: {e}")
+        # Only now may other threads skip the check and open connections against the schema
+        _catalogue_schema_checked = True
+
+def _open_catalogue_connection():
+    """Open a read-only catalogue.db connection tuned for read-heavy search workloads."""
+    _ensure_catalogue_schema()
+    conn = sqlite3.connect(CATALOGUE_DB, check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # name-addressable rows built in C, no per-row zip()
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    return conn
+
+_catalogue_tls = threading.local()
+
+def _catalogue_file_key():
+    """Identity of the catalogue.db file on disk, or None while it is missing (e.g. mid-reimport)."""
+    try:
+        st = os.stat(CATALOGUE_DB)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns)
+
+def _conn():
+    """Per-thread long-lived catalogue connection, so the page cache is reused across queries.
+    Reopened when catalogue.db is replaced or rewritten (reimport, migration by another worker)."""
+    global _catalogue_schema_checked
+    conn = getattr(_catalogue_tls, 'conn', None)
+    key = _catalogue_file_key()
+    if conn is not None and key is not None and key != _catalogue_tls.key:
+        conn.close()
+        conn = None
+        with _catalogue_schema_lock:
+            _catalogue_schema_checked = False
+    if conn is None:
+        conn = _open_catalogue_connection()
+        _catalogue_tls.conn = conn
+        # Read after opening: the schema check may itself have rewritten the file
+        _catalogue_tls.key = _catalogue_file_key()
+    return conn
+
 # -------------------------
 # Core Query Functions
 # -------------------------
+# Collection statistics change only on reimport, so cache them briefly
+STATS_CACHE_TTL = 60  # seconds
+_stats_cache = {"at": 0.0, "value": None}
+
 def get_library_statistics():
     """Get total number of books and other library statistics."""
     try:
         if not os.path.exists(CATALOGUE_DB):
             logger.error("Catalogue database not found")
             return None
-            
-        # Use context manager to ensure connection cleanup
-        with sqlite3.connect(CATALOGUE_DB) as conn:
-            cursor = conn.cursor()
-        
-        # Get total unique titles (based on ISBN or title)
-        cursor.execute("SELECT COUNT(DISTINCT COALESCE(isbn, title)) FROM catalogue WHERE title IS NOT NULL")
-        total_books = cursor.fetchone()[0]
-        
-        # Get total copies
-        cursor.execute("SELECT COUNT(*) FROM catalogue")
-        total_copies = cursor.fetchone()[0]
         
-        # Get unique authors
-        cursor.execute("SELECT COUNT(DISTINCT author) FROM catalogue WHERE author IS NOT NULL AND author != ''")
-        total_authors = cursor.fetchone()[0]
-        
-        conn.close()
+        now = time.time()
+        if _stats_cache["value"] is not None and now - _stats_cache["at"] < STATS_CACHE_TTL:
+            return _stats_cache["value"]
+            
+        cursor = _conn().cursor()
+        
+        # Unique titles (ISBN or title), total copies and unique authors in a single table scan
+        cursor.execute("""
+            SELECT
+                COUNT(DISTINCT CASE WHEN title IS NOT NULL THEN COALESCE(isbn, title) END),
+                COUNT(*),
+                COUNT(DISTINCT CASE WHEN author != '' THEN author END)
+            FROM catalogue
+        """)
+        total_books, total_copies, total_authors = cursor.fetchone()
         
         logger.info(f"📊 Retrieved library statistics: {total_books} titles, {total_copies} copies")
         
-        return {
+        stats = {
             "intent": "statistics",
             "answer": f"📊 **Library Collection Statistics:**\n\n• **Total Unique Titles:** {total_books:,} books\n• **Total Copies:** {total_copies:,} items\n• **Authors Represented:** {total_authors:,} different authors\n\nOur collection is continuously growing to serve the academic needs of IIT Ropar."
         }
+        _stats_cache.update(at=now, value=stats)
+        return stats
     except Exception as e:
         logger.error(f"Error getting library statistics: {e}")
         return {
@@ -1464,10 +1800,22 @@ def get_library_statistics():
             "answer": "I apologize, but I'm currently unable to retrieve the exact statistics. Please contact the library help desk for this information."
         }
 
-def extract_query_intent(query: str) -> dict:
+# Static patterns for extract_query_intent / expand_book_query, compiled once at import
+_QUESTION_WORDS = ('what', 'when', 'where', 'who', 'why', 'how', 'which', 'can', 'is', 'are', 'do', 'does')
+_QUESTION_WORD_RES = tuple(re.compile(rf'\b{qw}\s+') for qw in _QUESTION_WORDS)
+_QUERY_FILLERS = ('please', 'tell me', 'i want to know', 'can you', 'could you', 'about', 'the')
+_AUTHOR_PATTERN_RES = (
+    re.compile(r'by\s+([a-z\s]+)'),
+    re.compile(r'author[:\s]+([a-z\s]+)'),
+    re.compile(r'written\s+by\s+([a-z\s]+)'),
+)
+
+@lru_cache(maxsize=4096)
+def extract_query_intent(query: str) -> MappingProxyType:
     """
     Extract semantic intent from query for better understanding.
-    Returns dict with intent type, key entities, and query variations.
+    Returns a read-only mapping (shared via the LRU cache) with intent type, key entities,
+    and query variations as tuples.
     """
     query_lower = query.lower().strip()
     
@@ -1475,34 +1823,82 @@ def extract_query_intent(query: str) -> dict:
         "original": query,
         "normalized": query_lower,
         "intent_type": None,
-        "entities": [],
-        "alternatives": []
+        "entities": (),
+        "alternatives": ()
     }
     
     # Detect question words for conversational understanding
-    question_words = ['what', 'when', 'where', 'who', 'why', 'how', 'which', 'can', 'is', 'are', 'do', 'does']
-    has_question = any(query_lower.startswith(qw) for qw in question_words)
+    has_question = query_lower.startswith(_QUESTION_WORDS)
     
     # Generate query alternatives for better matching
     alternatives = [query_lower]
     
     # Remove question words for alternative matching
     if has_question:
-        for qw in question_words:
-            alt = re.sub(rf'\b{qw}\s+', '', query_lower, count=1)
+        for qw_re in _QUESTION_WORD_RES:
+            alt = qw_re.sub('', query_lower, count=1)
             if alt != query_lower:
                 alternatives.append(alt.strip())
     
+    # Whitespace-normalized form (collapses double spaces even when no filler word matches)
+    normalized = ' '.join(query_lower.split())
+    if normalized and normalized != query_lower:
+        alternatives.append(normalized)
+    
     # Remove common filler words
-    fillers = ['please', 'tell me', 'i want to know', 'can you', 'could you', 'about', 'the']
-    for filler in fillers:
+    for filler in _QUERY_FILLERS:
+        if filler not in query_lower:
+            continue
         alt = query_lower.replace(filler, ' ').strip()
         alt = ' '.join(alt.split())  # Normalize whitespace
         if alt and alt != query_lower:
             alternatives.append(alt)
     
-    intent_data["alternatives"] = list(set(alternatives))
-    return intent_data
+    intent_data["alternatives"] = tuple(dict.fromkeys(alternatives))  # ordered dedup: original query first
+    return MappingProxyType(intent_data)
+
+# Parsed general_queries.json keyed on file mtime; string answers are normalized to dicts at load
+# "keysets" holds (key, lowercased word set, word list) per FAQ key for the keyword scorer
+_general_queries_cache = {"mtime": None, "data": None, "keys": [], "keysets": []}
+
+def _load_general_queries() -> dict:
+    """
+    Return general_queries.json as {question: answer_dict}, re-reading it only when the file changes.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    mtime = os.stat(GENERAL_QUERIES).st_mtime
+    if _general_queries_cache["mtime"] == mtime:
+        return _general_queries_cache["data"]
+
+    with open(GENERAL_QUERIES, 'r', encoding='utf-8') as f:
+        general_queries = json.load(f)
+    for question, answer in general_queries.items():
+        if not isinstance(answer, dict):
+            general_queries[question] = json.loads(answer.replace("'", '"'))
+
+    keysets = [(key, frozenset(key.lower().split()), key.split()) for key in general_queries]
+    _general_queries_cache.update(mtime=mtime, data=general_queries, keys=list(general_queries), keysets=keysets)
+    return general_queries
+
+# Synonym expansion for the keyword-scoring fallback in get_general_answer
+_FAQ_SYNONYMS = {
+    'hours': {'timing', 'timings', 'time', 'schedule', 'open', 'close', 'timing', 'hours'},
+    'timing': {'hours', 'timings', 'time', 'schedule', 'open', 'when'},
+    'timings': {'hours', 'timing', 'time', 'schedule', 'open', 'when'},
+    'open': {'timing', 'hours', 'schedule', 'timings', 'available', 'accessible'},
+    'fine': {'penalty', 'charge', 'fee', 'fines', 'late fee', 'overdue'},
+    'book': {'books', 'title', 'titles', 'volume', 'publication'},
+    'renew': {'renewal', 'extend', 'extension', 'reissue'},
+    'issue': {'borrow', 'checkout', 'take', 'get', 'loan'},
+    'return': {'submit', 'give back', 'bring back'},
+    'search': {'find', 'look', 'locate', 'discover'},
+    'find': {'search', 'look', 'locate', 'get'},
+    'e-journals': {'ejournal', 'ejournals', 'e-journal', 'journal', 'journals', 'e-resources', 'digital', 'online'},
+    'ejournal': {'e-journals', 'ejournals', 'e-journal', 'journals', 'e-resources'},
+    'e-resources': {'eresources', 'e-journals', 'ejournals', 'digital', 'online', 'electronic'},
+    'help': {'assist', 'support', 'guide', 'information'},
+    'access': {'use', 'get', 'obtain', 'available'},
+}
 
 def get_general_answer(query):
     """
@@ -1518,12 +1914,11 @@ def get_general_answer(query):
         dict: Answer data with 'intent' and 'answer' keys, or None
     """
     try:
-        if not os.path.exists(GENERAL_QUERIES):
+        try:
+            general_queries = _load_general_queries()
+        except FileNotFoundError:
             logger.warning("general_queries.json not found")
             return None
-            
-        with open(GENERAL_QUERIES, 'r', encoding='utf-8') as f:
-            general_queries = json.load(f)
         
         # Extract intent and generate query alternatives
         intent_data = extract_query_intent(query)
@@ -1531,23 +1926,23 @@ def get_general_answer(query):
         query_alternatives = intent_data["alternatives"]
         
         # STRATEGY 1: Exact match on original and alternatives
-        for alt_query in [query_lower] + query_alternatives:
+        for alt_query in (query_lower,) + query_alternatives:
             if alt_query in general_queries:
                 logger.info(f"✅ Exact match found for '{alt_query}'")
-                result = general_queries[alt_query]
-                if isinstance(result, dict):
-                    return result
-                return json.loads(result.replace("'", '"'))
+                return general_queries[alt_query]
         
         # STRATEGY 2: Fuzzy string matching
+        faq_keys = _general_queries_cache["keys"]
         for alt_query in query_alternatives:
-            matches = get_close_matches(alt_query, general_queries.keys(), n=3, cutoff=0.75)
-            if matches:
-                logger.info(f"✅ Fuzzy match found: '{alt_query}' → '{matches[0]}'")
-                result = general_queries[matches[0]]
-                if isinstance(result, dict):
-                    return result
-                return json.loads(result.replace("'", '"'))
+            if HAS_RAPIDFUZZ:
+                match = rf_process.extractOne(alt_query, faq_keys, scorer=rf_fuzz.ratio, score_cutoff=75)
+                best_key = match[0] if match else None
+            else:
+                matches = get_close_matches(alt_query, faq_keys, n=1, cutoff=0.75)
+                best_key = matches[0] if matches else None
+            if best_key:
+                logger.info(f"✅ Fuzzy match found: '{alt_query}' → '{best_key}'")
+                return general_queries[best_key]
         
         # ⚡ STRATEGY 3: FAISS Semantic Search (NEW - BEST)
         logger.info("🔍 Trying FAISS semantic search for general query...")
@@ -1559,40 +1954,19 @@ def get_general_answer(query):
         # STRATEGY 4: Advanced semantic matching with expanded synonyms
         query_words = set(query_lower.split())
         
-        # Comprehensive synonym mapping
-        synonyms = {
-            'hours': {'timing', 'timings', 'time', 'schedule', 'open', 'close', 'timing', 'hours'},
-            'timing': {'hours', 'timings', 'time', 'schedule', 'open', 'when'},
-            'timings': {'hours', 'timing', 'time', 'schedule', 'open', 'when'},
-            'open': {'timing', 'hours', 'schedule', 'timings', 'available', 'accessible'},
-            'fine': {'penalty', 'charge', 'fee', 'fines', 'late fee', 'overdue'},
-            'book': {'books', 'title', 'titles', 'volume', 'publication'},
-            'renew': {'renewal', 'extend', 'extension', 'reissue'},
-            'issue': {'borrow', 'checkout', 'take', 'get', 'loan'},
-            'return': {'submit', 'give back', 'bring back'},
-            'search': {'find', 'look', 'locate', 'discover'},
-            'find': {'search', 'look', 'locate', 'get'},
-            'e-journals': {'ejournal', 'ejournals', 'e-journal', 'journal', 'journals', 'e-resources', 'digital', 'online'},
-            'ejournal': {'e-journals', 'ejournals', 'e-journal', 'journals', 'e-resources'},
-            'e-resources': {'eresources', 'e-journals', 'ejournals', 'digital', 'online', 'electronic'},
-            'help': {'assist', 'support', 'guide', 'information'},
-            'access': {'use', 'get', 'obtain', 'available'},
-        }
-        
         # Expand query words with synonyms
         expanded_query = set(query_words)
         for word in query_words:
-            if word in synonyms:
-                expanded_query.update(synonyms[word])
+            if word in _FAQ_SYNONYMS:
+                expanded_query.update(_FAQ_SYNONYMS[word])
         
         # Score-based matching with multiple factors
         best_match = None
         best_score = 0
         match_details = {}
+        query_word_list = query_lower.split()
         
-        for key in general_queries.keys():
-            key_words = set(key.lower().split())
-            
+        for key, key_words, key_word_list in _general_queries_cache["keysets"]:
             # Factor 1: Direct word overlap
             common_words = expanded_query & key_words
             overlap_score = len(common_words) / max(len(query_words), len(key_words)) if len(common_words) > 0 else 0
@@ -1608,8 +1982,6 @@ def get_general_answer(query):
             # Factor 3: Word order similarity (boost if words appear in similar order)
             order_boost = 0
             if overlap_score > 0:
-                query_word_list = query_lower.split()
-                key_word_list = key.split()
                 common_in_order = sum(1 for i, w in enumerate(query_word_list) 
                                      if i < len(key_word_list) and w in key_word_list[max(0, i-1):min(len(key_word_list), i+2)])
                 if common_in_order > 0:
@@ -1631,10 +2003,7 @@ def get_general_answer(query):
         # Lowered threshold for better recall (0.35 instead of 0.50)
         if best_match and best_score > 0.35:
             logger.info(f"✅ Semantic match: '{query}' → '{best_match}' (score: {best_score:.2f}, details: {match_details})")
-            result = general_queries[best_match]
-            if isinstance(result, dict):
-                return result
-            return json.loads(result.replace("'", '"'))
+            return general_queries[best_match]
         
         logger.info(f"⚠️ No match found in general queries for '{query}' (best score: {best_score:.2f})")
         return None
@@ -1643,10 +2012,11 @@ def get_general_answer(query):
         logger.error(f"Error in get_general_answer: {e}")
         return None
 
-def expand_book_query(query: str) -> list:
+@lru_cache(maxsize=4096)
+def expand_book_query(query: str) -> tuple:
     """
     Generate query variations for better book search recall.
-    Returns list of query variations to try.
+    Returns tuple of query variations to try (immutable, shared via the LRU cache).
     """
     variations = [query]
     query_lower = query.lower().strip()
@@ -1660,13 +2030,8 @@ def expand_book_query(query: str) -> list:
                 variations.append(clean_query)
     
     # Extract author names (common patterns)
-    author_patterns = [
-        r'by\s+([a-z\s]+)',
-        r'author[:\s]+([a-z\s]+)',
-        r'written\s+by\s+([a-z\s]+)'
-    ]
-    for pattern in author_patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _AUTHOR_PATTERN_RES:
+        match = pattern.search(query_lower)
         if match:
             author = match.group(1).strip()
             if author and len(author) > 2:
@@ -1679,7 +2044,64 @@ def expand_book_query(query: str) -> list:
     if len(filtered_words) < len(words) and len(filtered_words) > 0:
         variations.append(' '.join(filtered_words))
     
-    return list(set(variations))  # Remove duplicates
+    return tuple(dict.fromkeys(variations))  # Remove duplicates, keeping the original query first
+
+# Relevance scoring shared by the FTS and LIKE catalogue searches (catalogue aliased as c)
+_CATALOGUE_RELEVANCE_SQL = """
+    CASE
+        WHEN LOWER(c.title) = LOWER(?) THEN 100
+        WHEN c.title LIKE ? THEN 80
+        WHEN c.author LIKE ? THEN 70
+        WHEN LOWER(c.isbn) = LOWER(?) THEN 90
+        WHEN c.call_number LIKE ? THEN 50
+        ELSE 30
+    END"""
+
+# Inverted-index lookup: relevance is only computed for matching rows, BM25 breaks ties
+_CATALOGUE_FTS_SQL = f"""
+SELECT {_CATALOGUE_COLUMNS}, {_CATALOGUE_RELEVANCE_SQL} AS relevance_score
+FROM catalogue_fts JOIN catalogue c ON c.rowid = catalogue_fts.rowid
+WHERE catalogue_fts MATCH ?
+ORDER BY relevance_score DESC, bm25(catalogue_fts)
+LIMIT ?
+"""
+
+# Substring scan fallback (LIKE is already ASCII case-insensitive, so columns are not wrapped in LOWER())
+_CATALOGUE_LIKE_SQL = f"""
+SELECT {_CATALOGUE_COLUMNS}, {_CATALOGUE_RELEVANCE_SQL} AS relevance_score
+FROM catalogue c
+WHERE c.title LIKE ?
+OR c.author LIKE ?
+OR c.isbn LIKE ?
+OR c.call_number LIKE ?
+ORDER BY relevance_score DESC
+LIMIT ?
+"""
+
+# Fast path: exact title/ISBN hits served straight from the LOWER() expression indexes
+_CATALOGUE_EXACT_SQL = f"""
+SELECT {_CATALOGUE_COLUMNS}, {_CATALOGUE_RELEVANCE_SQL} AS relevance_score
+FROM catalogue c
+WHERE LOWER(c.title) = LOWER(?)
+OR LOWER(c.isbn) = LOWER(?)
+ORDER BY relevance_score DESC
+LIMIT ?
+"""
+
+# Substring fallback over the search_blob shadow column: one instr() scan per row
+_CATALOGUE_BLOB_SQL = f"""
+SELECT {_CATALOGUE_COLUMNS}, {_CATALOGUE_RELEVANCE_SQL} AS relevance_score
+FROM catalogue c
+WHERE instr(c.search_blob, LOWER(?)) > 0
+ORDER BY relevance_score DESC
+LIMIT ?
+"""
+
+_FTS_TOKEN_RE = re.compile(r'\w+')
+
+def _fts_match_expression(text: str) -> str:
+    """Turn free text into a safe FTS5 query: each word as a quoted prefix term (all must match)."""
+    return ' '.join(f'"{token}"*' for token in _FTS_TOKEN_RE.findall(text.lower()))
 
 def search_catalogue(query, limit=10):
     """
@@ -1693,59 +2115,60 @@ def search_catalogue(query, limit=10):
             logger.error("Catalogue database not found")
             return []
             
-        conn = sqlite3.connect(CATALOGUE_DB)
-        cursor = conn.cursor()
+        cursor = _conn().cursor()
         
-        # Generate query variations
-        query_variations = expand_book_query(query)
         all_results = []
         seen_ids = set()
         
-        for q_var in query_variations:
-            # Multi-field search with relevance scoring
-            sql = """
-            SELECT *, 
-                CASE 
-                    WHEN LOWER(title) = LOWER(?) THEN 100
-                    WHEN LOWER(title) LIKE LOWER(?) THEN 80
-                    WHEN LOWER(author) LIKE LOWER(?) THEN 70
-                    WHEN LOWER(isbn) = LOWER(?) THEN 90
-                    WHEN LOWER(call_number) LIKE LOWER(?) THEN 50
-                    ELSE 30
-                END as relevance_score
-            FROM catalogue 
-            WHERE LOWER(title) LIKE LOWER(?) 
-            OR LOWER(author) LIKE LOWER(?) 
-            OR LOWER(isbn) LIKE LOWER(?)
-            OR LOWER(call_number) LIKE LOWER(?)
-            ORDER BY relevance_score DESC
-            LIMIT ?
-            """
-            
-            exact_match = q_var
-            fuzzy_match = f"%{q_var}%"
-            
-            cursor.execute(sql, [
-                exact_match, fuzzy_match, fuzzy_match, exact_match, fuzzy_match,
-                fuzzy_match, fuzzy_match, fuzzy_match, fuzzy_match, limit * 2
-            ])
-            
-            columns = [desc[0] for desc in cursor.description]
+        def _collect(sql, params):
+            """Run one search query and append unseen rows; True once the limit is filled."""
+            cursor.execute(sql, params)
             for row in cursor.fetchall():
-                result = dict(zip(columns, row))
-                # Use a combination of fields as unique ID
-                result_id = f"{result.get('title', '')}-{result.get('author', '')}-{result.get('isbn', '')}"
+                result = dict(row)
+                # Use a combination of fields as unique ID (tuple: hashed without building a string)
+                result_id = (result.get('title'), result.get('author'), result.get('isbn'))
                 if result_id not in seen_ids:
                     seen_ids.add(result_id)
                     all_results.append(result)
                 
                 if len(all_results) >= limit:
+                    return True
+            return False
+        
+        # Exact title/ISBN matches that already fill the limit need no expansion at all
+        q = query.strip()
+        if _collect(_CATALOGUE_EXACT_SQL, [q, f"%{q}%", f"%{q}%", q, f"%{q}%", q, q, limit]):
+            query_variations = []
+        else:
+            # Generate query variations; case-only duplicates would rerun identical (case-insensitive) SQL
+            query_variations = list({v.strip().lower(): v.strip() for v in expand_book_query(query) if v.strip()}.values())
+        
+        # Full-text index first; if it finds nothing (e.g. mid-word substrings), retry with LIKE
+        search_modes = (True, False) if _catalogue_schema_version >= FTS_SCHEMA_VERSION else (False,)
+        exact_hits = len(all_results)
+        for use_fts in search_modes:
+            for q_var in query_variations:
+                exact_match = q_var
+                fuzzy_match = f"%{q_var}%"
+                relevance_params = [exact_match, fuzzy_match, fuzzy_match, exact_match, fuzzy_match]
+                
+                if use_fts:
+                    match_expr = _fts_match_expression(q_var)
+                    if not match_expr:
+                        continue
+                    filled = _collect(_CATALOGUE_FTS_SQL, relevance_params + [match_expr, limit * 2])
+                elif _catalogue_schema_version >= SEARCH_BLOB_SCHEMA_VERSION:
+                    filled = _collect(_CATALOGUE_BLOB_SQL, relevance_params + [q_var, limit * 2])
+                else:
+                    filled = _collect(_CATALOGUE_LIKE_SQL, relevance_params + [
+                        fuzzy_match, fuzzy_match, fuzzy_match, fuzzy_match, limit * 2
+                    ])
+                if filled:
                     break
             
-            if len(all_results) >= limit:
+            if len(all_results) > exact_hits:
                 break
         
-        # Connection closed automatically by context manager
         # Sort by relevance score
         all_results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
         final_results = all_results[:limit]
@@ -1762,17 +2185,15 @@ def search_catalogue_author(author_name, limit=20):
     try:
         if not author_name or not os.path.exists(CATALOGUE_DB):
             return []
-        sql = """
-        SELECT * FROM catalogue
-        WHERE author LIKE ?
+        sql = f"""
+        SELECT {_CATALOGUE_COLUMNS} FROM catalogue c
+        WHERE c.author LIKE ?
         LIMIT ?
         """
         term = f"%{author_name}%"
-        with sqlite3.connect(CATALOGUE_DB) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, (term, limit))
-            columns = [desc[0] for desc in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        cursor = _conn().cursor()
+        cursor.execute(sql, (term, limit))
+        results = [dict(row) for row in cursor.fetchall()]
         logger.info(f"👤 Author search found {len(results)} results for '{author_name}'")
         return results
     except Exception as e:
@@ -1808,27 +2229,30 @@ def semantic_search_tfidf_fallback(query, top_k=5):
     """
     try:
         from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.metrics.pairwise import cosine_similarity
         import numpy as np
 
         # Build or reuse cached TF-IDF resources
         global _tfidf_cache
         if '_built' not in _tfidf_cache:
             start = time.time()
-            conn = sqlite3.connect(str(CATALOGUE_DB))
-            cursor = conn.cursor()
+            cursor = _conn().cursor()
             # Also fetch rowid so we can map back to full records efficiently
             cursor.execute("SELECT rowid, title, author FROM catalogue")
-            rows = cursor.fetchall()
-            conn.close()
+            rowids = array('q')
 
-            if not rows:
-                return []
+            def _iter_corpus():
+                # Stream rows from the cursor straight into the vectorizer (no full fetchall/corpus lists)
+                for rowid, title, author in cursor:
+                    rowids.append(rowid)
+                    yield f"{title or ''} {author or ''}"
 
-            rowids = [r[0] for r in rows]
-            corpus = [f"{r[1] or ''} {r[2] or ''}" for r in rows]
-            vectorizer = TfidfVectorizer(max_features=3000, stop_words='english')
-            tfidf_matrix = vectorizer.fit_transform(corpus)
+            # float32 halves matrix memory and bandwidth; similarity ranking does not need doubles
+            vectorizer = TfidfVectorizer(max_features=3000, stop_words='english', dtype=np.float32)
+            try:
+                tfidf_matrix = vectorizer.fit_transform(_iter_corpus())
+            except ValueError:
+                # Empty catalogue (empty vocabulary)
+                return []
 
             _tfidf_cache['vectorizer'] = vectorizer
             _tfidf_cache['matrix'] = tfidf_matrix
@@ -1840,11 +2264,16 @@ def semantic_search_tfidf_fallback(query, top_k=5):
         tfidf_matrix = _tfidf_cache['matrix']
         rowids = _tfidf_cache['rowids']
 
-        query_vec = vectorizer.transform([query])
-        similarities = cosine_similarity(query_vec, tfidf_matrix).flatten()
+        # TfidfVectorizer rows are already L2-normalized, so cosine similarity is a sparse dot product
+        query_vec = vectorizer.transform([query]).astype(np.float32, copy=False)
+        similarities = (tfidf_matrix @ query_vec.T).toarray().ravel()
 
-        # Top-k indices by similarity
-        top_indices = np.argsort(similarities)[::-1][:top_k * 2]
+        # Top-k indices by similarity: O(N) partition, then sort only the k candidates
+        k = min(top_k * 2, similarities.size)
+        if k <= 0:
+            return []
+        top_indices = np.argpartition(-similarities, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
 
         # Fetch corresponding records (apply threshold)
         selected_rowids = [rowids[i] for i in top_indices if similarities[i] > 0.1][:top_k]
@@ -1854,15 +2283,13 @@ def semantic_search_tfidf_fallback(query, top_k=5):
         # Retrieve full rows for selected rowids preserving order
         placeholders = ','.join(['?'] * len(selected_rowids))
         # Secure parameterized retrieval (avoid f-string SQL injection vector)
-        with sqlite3.connect(str(CATALOGUE_DB)) as conn:
-            cursor = conn.cursor()
-            sql = f"SELECT rowid, * FROM catalogue WHERE rowid IN ({placeholders})"
-            cursor.execute(sql, selected_rowids)  # parameters safely bound
-            fetched = cursor.fetchall()
-            col_names = [desc[0] for desc in cursor.description]
+        cursor = _conn().cursor()
+        sql = f"SELECT c.rowid, {_CATALOGUE_COLUMNS} FROM catalogue c WHERE c.rowid IN ({placeholders})"
+        cursor.execute(sql, selected_rowids)  # parameters safely bound
+        fetched = cursor.fetchall()
 
         # Map by rowid to keep original top-k order
-        by_rowid = {r[0]: dict(zip(col_names, r)) for r in fetched}
+        by_rowid = {r[0]: dict(r) for r in fetched}
         results = [by_rowid[rid] for rid in selected_rowids if rid in by_rowid]
         logger.info(f"🔍 TF-IDF fallback returned {len(results)} results")
         return results
@@ -1874,17 +2301,112 @@ def semantic_search_tfidf_fallback(query, top_k=5):
 # GLOBAL MODEL LOADING (once at startup)
 # ========================
 _sentence_transformer_model = None
+SENTENCE_MODEL_PATH = Path(__file__).parent / "models" / "all-MiniLM-L6-v2"
+ONNX_MODEL_FILE = Path(__file__).parent / "models" / "all-MiniLM-L6-v2-int8.onnx"
+
+def _quantize_model_if_needed() -> Path:
+    """
+    Export the model's transformer to ONNX and apply dynamic int8 quantization.
+    Runs once; the quantized graph is cached next to the model directory.
+    """
+    if ONNX_MODEL_FILE.exists():
+        return ONNX_MODEL_FILE
+
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info("🔄 Exporting SentenceTransformer to ONNX + int8 (one-time)...")
+    start = time.time()
+    st_model = SentenceTransformer(str(SENTENCE_MODEL_PATH), device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    sample = st_model.tokenizer(["library timings"], return_tensors="pt")
+
+    fp32_file = ONNX_MODEL_FILE.with_suffix(".fp32.tmp")
+    int8_file = ONNX_MODEL_FILE.with_suffix(".int8.tmp")
+    seq_axes = {0: "batch", 1: "seq"}
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            (sample["input_ids"], sample["attention_mask"]),
+            str(fp32_file),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={"input_ids": seq_axes, "attention_mask": seq_axes, "last_hidden_state": seq_axes},
+            opset_version=14,
+        )
+    quantize_dynamic(str(fp32_file), str(int8_file), weight_type=QuantType.QInt8)
+    os.replace(int8_file, ONNX_MODEL_FILE)  # publish atomically so a crash never leaves a partial model
+    fp32_file.unlink(missing_ok=True)
+    logger.info(f"✅ ONNX int8 model written to {ONNX_MODEL_FILE.name} in {time.time() - start:.2f}s")
+    return ONNX_MODEL_FILE
+
+class _OnnxSentenceEncoder:
+    """
+    ONNX Runtime stand-in for SentenceTransformer.encode on all-MiniLM-L6-v2:
+    fast tokenizer -> int8 transformer -> mean pooling -> L2 normalize (the model's own module stack).
+    """
+
+    def __init__(self, onnx_file: Path, model_path: Path, max_seq_length: int = 256):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = os.cpu_count() or 1
+        self._session = ort.InferenceSession(str(onnx_file), options, providers=["CPUExecutionProvider"])
+        self._tokenizer = AutoTokenizer.from_pretrained(str(model_path), use_fast=True)
+        self._max_seq_length = max_seq_length
+
+    def encode(self, sentences, batch_size: int = 32, convert_to_numpy: bool = True,
+               normalize_embeddings: bool = True, **kwargs):
+        import numpy as np
+
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        # Longest first, so each batch pads to similar lengths
+        order = np.argsort([-len(s) for s in sentences], kind="stable")
+        chunks = []
+        for start in range(0, len(sentences), batch_size):
+            batch = [sentences[i] for i in order[start:start + batch_size]]
+            tokens = self._tokenizer(batch, padding=True, truncation=True,
+                                     max_length=self._max_seq_length, return_tensors="np")
+            mask = tokens["attention_mask"].astype(np.int64)
+            hidden = self._session.run(None, {
+                "input_ids": tokens["input_ids"].astype(np.int64),
+                "attention_mask": mask,
+            })[0]
+            weights = mask[..., None].astype(np.float32)
+            chunks.append((hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None))
+        if not chunks:
+            return np.zeros((0, self._session.get_outputs()[0].shape[-1]), dtype=np.float32)
+
+        embeddings = np.empty((len(sentences), chunks[0].shape[1]), dtype=np.float32)
+        embeddings[order] = np.concatenate(chunks)
+        # The model ends in a Normalize module, so embeddings are always unit length (as with SentenceTransformer)
+        embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings[0] if single else embeddings
 
 def _get_sentence_transformer():
     """Get or initialize the SentenceTransformer model (singleton pattern)."""
     global _sentence_transformer_model
+    if _sentence_transformer_model is None and USE_ONNX_ENCODER:
+        try:
+            start = time.time()
+            _sentence_transformer_model = _OnnxSentenceEncoder(_quantize_model_if_needed(), SENTENCE_MODEL_PATH)
+            _encode_cached.cache_clear()
+            logger.info(f"✅ ONNX int8 encoder loaded in {time.time() - start:.2f}s (will be reused)")
+        except Exception as e:
+            logger.warning(f"⚠️ ONNX encoder unavailable, falling back to SentenceTransformer: {e}")
     if _sentence_transformer_model is None:
         try:
             from sentence_transformers import SentenceTransformer
-            model_path = str(Path(__file__).parent / "models" / "all-MiniLM-L6-v2")
+            model_path = str(SENTENCE_MODEL_PATH)
             logger.info(f"🔄 Loading SentenceTransformer model from {model_path}...")
             start = time.time()
             _sentence_transformer_model = SentenceTransformer(model_path)
+            _encode_cached.cache_clear()
             elapsed = time.time() - start
             logger.info(f"✅ SentenceTransformer loaded in {elapsed:.2f}s (will be reused)")
         except Exception as e:
@@ -1892,117 +2414,284 @@ def _get_sentence_transformer():
             raise
     return _sentence_transformer_model
 
-# Cache FAISS indices (loaded once, reused for all searches)
-_faiss_cache = {}
+class _BatchSlot:
+    __slots__ = ("item", "result", "error", "done")
+
+    def __init__(self, item):
+        self.item = item
+        self.result = None
+        self.error = None
+        self.done = False
+
+class _MicroBatcher:
+    """
+    Coalesce concurrent single-item calls into one batched call (leader/follower).
+
+    Each caller queues its item, then competes for the run lock. Whoever gets it drains up to
+    max_batch queued items and runs batch_fn once for all of them; callers whose item was served
+    by another thread's batch just return its result. A lone caller runs immediately, so there is
+    no fixed coalescing delay when the server is idle.
+    """
+
+    def __init__(self, batch_fn, max_batch: int = 32):
+        self._batch_fn = batch_fn
+        self._max_batch = max_batch
+        self._queue_lock = threading.Lock()  # guards _pending
+        self._run_lock = threading.Lock()  # one batch in flight at a time
+        self._pending: List[_BatchSlot] = []
+
+    def submit(self, item):
+        slot = _BatchSlot(item)
+        with self._queue_lock:
+            self._pending.append(slot)
+        while not slot.done:
+            with self._run_lock:
+                if slot.done:
+                    break
+                with self._queue_lock:
+                    batch = self._pending[:self._max_batch]
+                    del self._pending[:self._max_batch]
+                try:
+                    results = self._batch_fn([s.item for s in batch])
+                    for s, result in zip(batch, results):
+                        s.result = result
+                except Exception as e:
+                    for s in batch:
+                        s.error = e
+                finally:
+                    for s in batch:
+                        s.done = True
+        if slot.error is not None:
+            raise slot.error
+        return slot.result
+
+def _encode_batch(texts: List[str]):
+    # SentenceTransformer sorts each batch by length internally, so padding stays minimal
+    return _get_sentence_transformer().encode(texts, batch_size=32, convert_to_numpy=True)
+
+_encode_batcher = _MicroBatcher(_encode_batch, max_batch=32)
+
+@lru_cache(maxsize=2048)  # ⚡ Repeated phrasings skip the transformer entirely
+def _encode_cached(query_norm: str):
+    embedding = _encode_batcher.submit(query_norm)
+    embedding.flags.writeable = False  # Shared by every caller that hits this entry
+    return embedding
+
+def encode_query(query: str):
+    """Embed one query as a (1, dim) array, sharing a model.encode call with concurrent requests."""
+    # The model is uncased and splits on whitespace, so this normalization keeps embeddings identical
+    return _encode_cached(" ".join(query.lower().split()))[None, :]
+
+def _search_batch(requests: List[tuple]):
+    """
+    Run queued (index, embedding, top_k) searches with one index.search per index:
+    embeddings are stacked, searched at the batch's largest k, and each row trimmed to its own k.
+    """
+    import numpy as np
+
+    results = [None] * len(requests)
+    by_index: Dict[int, List[int]] = {}
+    for pos, (index, _, _) in enumerate(requests):
+        by_index.setdefault(id(index), []).append(pos)
+    for positions in by_index.values():
+        index = requests[positions[0]][0]
+        max_k = max(requests[p][2] for p in positions)
+        queries = np.vstack([requests[p][1] for p in positions]).astype('float32', copy=False)
+        distances, indices = index.search(queries, max_k)
+        for row, p in enumerate(positions):
+            k = requests[p][2]
+            results[p] = (distances[row:row + 1, :k], indices[row:row + 1, :k])
+    return results
+
+_search_batcher = _MicroBatcher(_search_batch, max_batch=64)
+
+def search_index(index, query_embedding, top_k: int):
+    """
+    index.search for a single (1, dim) query, batched with concurrent searches so FAISS
+    can spread the rows over its OpenMP threads. Returns (distances, indices) like index.search.
+    """
+    return _search_batcher.submit((index, query_embedding[0], top_k))
+
+# Cache the TF-IDF fallback matrix (built once, reused for all searches)
 _tfidf_cache = {}
-_faiss_loading = False  # Prevent concurrent loads
 
-def _load_faiss_resources_generic(cache_dict, loading_flag_ref, index_file, mapping_file, log_message, timeout_message):
+class MappingView(Sequence):
+    """
+    Read-only list-of-dicts view over a memory-mapped Arrow mapping table.
+    Rows are materialized only when indexed, so loading the mapping is a single mmap.
+    Columns tagged with {"json": "1"} field metadata hold JSON-encoded nested values.
+    """
+
+    def __init__(self, table):
+        self._table = table
+        self._columns = [
+            (field.name, table.column(field.name), (field.metadata or {}).get(b"json") == b"1")
+            for field in table.schema
+        ]
+
+    def __len__(self):
+        return self._table.num_rows
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("mapping index out of range")
+        row = {}
+        for name, column, is_json in self._columns:
+            value = column[i].as_py()
+            row[name] = json.loads(value) if is_json and value is not None else value
+        return row
+
+def _load_mapping(mapping_file: Path):
+    """
+    Load a FAISS id -> record mapping. Prefers an up-to-date Arrow IPC sibling
+    (<name>.arrow, memory-mapped, zero-copy) and falls back to unpickling <name>.pkl.
     """
-    Generic FAISS resource loader to eliminate code duplication.
+    arrow_file = Path(mapping_file).with_suffix(".arrow")
+    if HAS_PYARROW and arrow_file.exists() and arrow_file.stat().st_mtime >= Path(mapping_file).stat().st_mtime:
+        table = pa.ipc.open_file(pa.memory_map(str(arrow_file), "r")).read_all()
+        return MappingView(table)
+    with open(mapping_file, "rb") as f:
+        return pickle.load(f)
+
+def _make_faiss_loader(index_file, mapping_file, label):
+    """
+    Build a loader that reads one FAISS index + mapping once and caches it.
 
     PERFORMANCE OPTIMIZED:
-    - Lazy loads on first search (not at app startup to avoid timeout)
-    - Caches in memory for subsequent queries
-    - Thread-safe loading prevention
+    - Lazy loads on first search, or from the pre-load at module init
+    - Caches in memory for subsequent queries (index mmap'd, mapping Arrow-backed when available)
+    - Thread-safe: concurrent first callers block on the lock and reuse the single load
 
     Args:
-        cache_dict: Cache dictionary to store loaded resources
-        loading_flag_ref: Reference to loading flag variable
         index_file: Path to FAISS index file
         mapping_file: Path to mapping pickle file
-        log_message: Loading log message
-        timeout_message: Timeout error message
+        label: Name used in log messages
 
     Returns:
-        tuple: (model, index, mapping)
-    """
-    # Get the global loading flag
-    loading_flag = loading_flag_ref
-
-    # Return cached if available
-    if 'model' in cache_dict:
-        return cache_dict['model'], cache_dict['index'], cache_dict['mapping']
-
-    # Prevent concurrent loading
-    if loading_flag:
-        logger.warning("⏳ FAISS already loading in another thread, waiting...")
-        # Wait for up to 10 seconds for the other load to complete
-        for _ in range(20):
-            time.sleep(0.5)
-            if 'model' in cache_dict:
-                return cache_dict['model'], cache_dict['index'], cache_dict['mapping']
-        raise Exception(timeout_message)
-
-    # Set loading flag
-    loading_flag_ref = True
-    try:
-        import faiss
+        callable: load() -> (model, index, mapping); its cache dict is exposed as load.cache
+    """
+    cache = {}
+    lock = threading.Lock()
 
-        logger.info(log_message)
-        start = time.time()
+    def load():
+        # Return cached if available (lock-free fast path)
+        if 'model' in cache:
+            return cache['model'], cache['index'], cache['mapping']
 
-        # Reuse the global SentenceTransformer model
-        model = _get_sentence_transformer()
-        index = faiss.read_index(str(index_file))
-        with open(mapping_file, "rb") as f:
-            mapping = pickle.load(f)
+        with lock:
+            # Another thread may have finished loading while we waited for the lock
+            if 'model' in cache:
+                return cache['model'], cache['index'], cache['mapping']
 
-        cache_dict['model'] = model
-        cache_dict['index'] = index
-        cache_dict['mapping'] = mapping
+            import faiss
 
-        elapsed = time.time() - start
-        logger.info(f"✅ FAISS resources loaded and cached in {elapsed:.2f}s")
+            logger.info(f"🔄 Loading {label} FAISS index...")
+            start = time.time()
 
-        return model, index, mapping
-    finally:
-        loading_flag_ref = False
-
-def _load_faiss_resources():
-    """Load and cache FAISS model, index, and mapping for catalogue search."""
-    global _faiss_loading
-    return _load_faiss_resources_generic(
-        _faiss_cache, _faiss_loading, INDEX_FILE, MAPPING_FILE,
-        "🔄 Loading FAISS catalogue index (first query only)...",
-        "FAISS loading timeout"
-    )
-
-# Pre-load FAISS resources on import to reduce first-search latency
-try:
-    import threading
-    def preload_faiss():
-        try:
-            logger.info("🔄 Pre-loading FAISS resources in background...")
-            start_time = time.time()
-            _load_faiss_resources()
-            load_time = time.time() - start_time
-            logger.info(f"✅ FAISS resources pre-loaded in {load_time:.2f}s")
-        except Exception as e:
-            logger.warning(f"Failed to pre-load FAISS: {e}")
-    
-    preload_thread = threading.Thread(target=preload_faiss, daemon=True)
-    preload_thread.start()
-except Exception as e:
-    logger.warning(f"Could not start FAISS preloading: {e}")
+            # Reuse the global SentenceTransformer model
+            model = _get_sentence_transformer()
+            try:
+                # Map the index file instead of copying it into RAM: pages load on demand and are
+                # shared through the page cache by every worker process
+                index = faiss.read_index(str(index_file), faiss.IO_FLAG_MMAP)
+            except RuntimeError as e:
+                logger.warning(f"⚠️ mmap read not supported for {Path(index_file).name} ({e}), loading into memory")
+                index = faiss.read_index(str(index_file))
+            mapping = _load_mapping(mapping_file)
+            if FAISS_OMP_THREADS > 0:
+                faiss.omp_set_num_threads(FAISS_OMP_THREADS)
+            if hasattr(index, 'hnsw'):
+                # Graph index (IndexHNSWFlat): searches visit ~log(N) * efSearch vectors instead of all N
+                index.hnsw.efSearch = HNSW_EF_SEARCH
+                logger.info(f"🔧 HNSW index detected, efSearch={HNSW_EF_SEARCH}")
+            elif hasattr(index, 'nprobe'):
+                # Partitioned index (e.g. IndexIVFScalarQuantizer): only nprobe of nlist lists are scanned
+                index.nprobe = min(IVF_NPROBE, index.nlist)
+                logger.info(f"🔧 IVF index detected, nprobe={index.nprobe}/{index.nlist}")
+
+            # Publish 'model' last: the unlocked fast path keys on it
+            cache['index'] = index
+            cache['mapping'] = mapping
+            cache['model'] = model
+
+            elapsed = time.time() - start
+            logger.info(f"✅ {label.capitalize()} FAISS resources loaded and cached in {elapsed:.2f}s")
+
+            return model, index, mapping
+
+    load.cache = cache
+    return load
+
+# Catalogue search (model, index, mapping), loaded once and reused for all searches
+_load_faiss_resources = _make_faiss_loader(INDEX_FILE, MAPPING_FILE, "catalogue")
 
 # -------------------------
 # General Queries FAISS Search
 # -------------------------
-_general_faiss_cache = {}
-_general_faiss_loading = False
+_load_general_faiss_resources = _make_faiss_loader(
+    GENERAL_QUERIES_INDEX_FILE, GENERAL_QUERIES_MAPPING_FILE, "general queries"
+)
 
-def _load_general_faiss_resources():
-    """
-    Load and cache FAISS resources for general queries semantic search.
+# In-memory FAQ index, used when the prebuilt general index is missing or older than the JSON
+_faq_index = {"mtime": None, "index": None, "mapping": None}
+
+def _general_index_is_current() -> bool:
+    """Check the prebuilt general queries index exists and is not older than general_queries.json."""
+    try:
+        index_mtime = os.stat(GENERAL_QUERIES_INDEX_FILE).st_mtime
+        os.stat(GENERAL_QUERIES_MAPPING_FILE)
+        return index_mtime >= os.stat(GENERAL_QUERIES).st_mtime
+    except FileNotFoundError:
+        return False
+
+def _get_faq_index():
     """
-    global _general_faiss_loading
-    return _load_faiss_resources_generic(
-        _general_faiss_cache, _general_faiss_loading, GENERAL_QUERIES_INDEX_FILE, GENERAL_QUERIES_MAPPING_FILE,
-        "🔄 Loading general queries FAISS index...",
-        "General FAISS loading timeout"
-    )
+    Build (once per general_queries.json version) a cosine-similarity FAISS index over the
+    FAQ questions, using L2-normalized embeddings in an IndexFlatIP.
 
+    Returns:
+        tuple: (index, mapping) where mapping[i] = {"question", "answer_data"}
+    """
+    mtime = os.stat(GENERAL_QUERIES).st_mtime
+    if _faq_index["mtime"] == mtime:
+        return _faq_index["index"], _faq_index["mapping"]
+
+    import faiss
+
+    logger.info("🔄 Building in-memory FAQ index from general_queries.json...")
+    start = time.time()
+    general_queries = _load_general_queries()
+    questions = list(general_queries.keys())
+    mapping = [{"question": q, "answer_data": general_queries[q]} for q in questions]
+
+    model = _get_sentence_transformer()
+    embeddings = model.encode(questions, convert_to_numpy=True, normalize_embeddings=True).astype('float32')
+    index = faiss.IndexFlatIP(embeddings.shape[1])
+    index.add(embeddings)
+
+    _faq_index.update(mtime=mtime, index=index, mapping=mapping)
+    with _faq_result_cache_lock:
+        _faq_result_cache.clear()  # answers cached against the previous index are stale
+    logger.info(f"✅ FAQ index built for {len(questions)} questions in {time.time() - start:.2f}s")
+    return index, mapping
+
+
+# Recent FAQ answers keyed on (index, threshold, int8-quantized query embedding), LRU-evicted
+FAQ_RESULT_CACHE_SIZE = 512
+_faq_result_cache: "OrderedDict[tuple, Optional[dict]]" = OrderedDict()
+_faq_result_cache_lock = threading.Lock()  # shared by request threads and hybrid search workers
+
+def _remember_faq_result(key: tuple, result: Optional[dict]) -> None:
+    """Store a semantic FAQ lookup result, evicting the least recently used entry when full."""
+    with _faq_result_cache_lock:
+        _faq_result_cache[key] = result
+        if len(_faq_result_cache) > FAQ_RESULT_CACHE_SIZE:
+            _faq_result_cache.popitem(last=False)
 
 def semantic_search_general_queries(query: str, top_k: int = 3, threshold: float = 0.5):
     """
@@ -2016,38 +2705,65 @@ def semantic_search_general_queries(query: str, top_k: int = 3, threshold: float
     Args:
         query: User's question
         top_k: Number of top matches to return
-        threshold: Similarity threshold (0-1, higher = stricter)
+        threshold: Cosine similarity threshold (higher = stricter). On indexes built before the
+            switch to IndexFlatIP, 1/(1+d) with squared L2 over unit vectors gives the same
+            cutoff at 0.5, so the default behaves alike on both.
     
     Returns:
         dict: Best matching answer data, or None if no good match
     """
     try:
-        # Check if FAISS index exists
-        if not GENERAL_QUERIES_INDEX_FILE.exists() or not GENERAL_QUERIES_MAPPING_FILE.exists():
-            logger.debug("General queries FAISS index not available, skipping semantic search")
+        import faiss
+
+        if _general_index_is_current():
+            # Load prebuilt FAISS resources (cached after first call)
+            model, index, mapping = _load_general_faiss_resources()
+        elif GENERAL_QUERIES.exists():
+            # Prebuilt index missing or stale: use the in-memory index over the current JSON
+            model = _get_sentence_transformer()
+            index, mapping = _get_faq_index()
+        else:
+            logger.debug("General queries not available, skipping semantic search")
             return None
         
-        # Load FAISS resources (cached after first call)
-        model, index, mapping = _load_general_faiss_resources()
-        
         # Encode query into embedding
-        query_embedding = model.encode([query])
-        
-        # Search using FAISS (L2 distance - lower is better)
-        distances, indices = index.search(query_embedding, top_k)
-        
-        # Convert L2 distance to similarity score (0-1, higher is better)
-        # Formula: similarity = 1 / (1 + distance)
-        similarities = [1 / (1 + dist) for dist in distances[0]]
-        
+        query_embedding = encode_query(query)
+        
+        # Rephrasings that quantize to the same int8 embedding reuse the earlier answer
+        cache_key = (id(index), threshold, (query_embedding[0] * 127).astype('int8').tobytes())
+        with _faq_result_cache_lock:
+            cache_hit = cache_key in _faq_result_cache
+            if cache_hit:
+                _faq_result_cache.move_to_end(cache_key)
+                cached_result = _faq_result_cache[cache_key]
+        if cache_hit:
+            logger.info(f"⚡ FAQ semantic cache hit for '{query[:50]}'")
+            return cached_result
+        
+        distances, indices = search_index(index, query_embedding, top_k)
+        
+        if index.metric_type == faiss.METRIC_INNER_PRODUCT:
+            # Inner product over normalized embeddings is already cosine similarity
+            similarities = distances[0]
+        else:
+            # Index built before the IP switch: convert L2 distance to similarity score (0-1, higher is better)
+            # Formula: similarity = 1 / (1 + distance), vectorized over the returned row
+            similarities = 1.0 / (1.0 + distances[0])
+
+        # FAISS pads unfilled result slots with -1 (top_k larger than the index)
+        valid = indices[0] >= 0
+        found, similarities = indices[0][valid], similarities[valid]
+        if not len(found):
+            return None
+
         # Get best match
-        best_idx = indices[0][0]
+        best_idx = found[0]
         best_similarity = similarities[0]
         
         logger.info(f"🔍 FAISS general search: '{query[:50]}...' → similarity={best_similarity:.3f}")
         
         # Log top 3 matches for debugging
-        for i, (idx, sim) in enumerate(zip(indices[0][:3], similarities[:3])):
+        for i, (idx, sim) in enumerate(zip(found[:3], similarities[:3])):
             match_question = mapping[idx]['question'][:60]
             logger.debug(f"  {i+1}. [{sim*100:.1f}%] {match_question}")
         
@@ -2055,10 +2771,12 @@ def semantic_search_general_queries(query: str, top_k: int = 3, threshold: float
         if best_similarity >= threshold:
             match = mapping[best_idx]
             logger.info(f"✅ FAISS match: '{match['question'][:60]}' (score: {best_similarity:.3f})")
-            return match['answer_data']
+            result = match['answer_data']
         else:
             logger.info(f"⚠️ No match found in general queries for '{query}' (best score: {best_similarity:.2f})")
-            return None
+            result = None
+        _remember_faq_result(cache_key, result)
+        return result
             
     except Exception as e:
         logger.warning(f"FAISS general search failed: {e}")
@@ -2073,18 +2791,22 @@ def semantic_search(query, top_k=5):
         
         # Use cached resources instead of loading every time
         model, index, mapping = _load_faiss_resources()
-        query_embedding = model.encode([query])
-        distances, indices = index.search(query_embedding, top_k)
-        results = []
-        for idx in indices[0]:
-            if idx < len(mapping):
-                results.append(mapping[idx])
+        query_embedding = encode_query(query)
+        distances, indices = search_index(index, query_embedding, top_k)
+        # Drop FAISS's -1 padding (and any ids past a stale mapping) with one mask
+        found = indices[0]
+        found = found[(found >= 0) & (found < len(mapping))]
+        results = [mapping[idx] for idx in found]
         logger.info(f"🔍 Found {len(results)} results via FAISS semantic search")
         return results
     except Exception as e:
         logger.warning(f"FAISS semantic search failed: {e}, trying TF-IDF fallback")
         return semantic_search_tfidf_fallback(query, top_k)
 
+# Runs semantic_search alongside the catalogue SQL search, and the per-book OPAC checks;
+# threads start on first use
+_hybrid_search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nandu-hybrid")
+
 def hybrid_book_search(query, intent: str | None = None, realtime_availability=False, check_availability=True):
     """Combine catalogue and semantic search, then merge duplicates.
     If intent == 'author', prefer author field in catalogue search.
@@ -2093,6 +2815,10 @@ def hybrid_book_search(query, intent: str | None = None, realtime_availability=F
     """
     all_results = []
     
+    # Semantic search is independent of the catalogue lookup: run it concurrently
+    # (FAISS and SQLite release the GIL; each thread uses its own SQLite connection)
+    semantic_future = _hybrid_search_executor.submit(semantic_search, query, 5)
+    
     # Try catalogue search (author-focused if intent indicates author)
     # Reduce limits for faster initial results
     if intent == "author":
@@ -2104,8 +2830,8 @@ def hybrid_book_search(query, intent: str | None = None, realtime_availability=F
     if catalogue_results:
         all_results.extend(catalogue_results)
     
-    # Try semantic search with reduced limit
-    semantic_results = semantic_search(query, top_k=5)
+    # Semantic search with reduced limit
+    semantic_results = semantic_future.result()
     if semantic_results:
         all_results.extend(semantic_results)
     
@@ -2119,7 +2845,8 @@ def hybrid_book_search(query, intent: str | None = None, realtime_availability=F
         # Add OPAC availability information to each book (only if OPAC is enabled)
         if check_availability and _get_webscrape_enabled():
             logger.info(f"🔍 Checking OPAC availability for {len(merged)} books...")
-            for book in merged:
+            
+            def check_book(book):
                 title = book.get('Title', book.get('title', ''))
                 author = book.get('Author', book.get('author', ''))
                 isbn = book.get('ISBN', book.get('isbn', ''))
@@ -2130,14 +2857,17 @@ def hybrid_book_search(query, intent: str | None = None, realtime_availability=F
                     # Split comma-separated string into list
                     accession_numbers = [acc.strip() for acc in accession_numbers.split(',') if acc.strip()]
                 
-                availability = check_book_availability_opac(
+                return check_book_availability_opac(
                     title=title, 
                     author=author, 
                     isbn=isbn,
                     accession_numbers=accession_numbers,
                     force_refresh=realtime_availability
                 )
-                
+            
+            # The lookups are independent network round-trips: overlap them (results keep book order)
+            for book, availability in zip(merged, _hybrid_search_executor.map(check_book, merged)):
+                title = book.get('Title', book.get('title', ''))
                 if availability:
                     book['opac_availability'] = availability
                     logger.info(f"📚 OPAC check for '{title}': {availability['status']}")
@@ -2389,8 +3119,8 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
         
     original_query = q.strip()
     
-    # Validate query is not gibberish
-    is_valid, error_msg = is_valid_query(original_query)
+    # Validate query is not gibberish, clean it and classify it (cached as one step)
+    is_valid, error_msg, cleaned_query, classification = validate_and_classify(original_query)
     if not is_valid:
         logger.warning(f"❌ Invalid/gibberish query rejected: '{original_query}'")
         response = error_msg
@@ -2398,10 +3128,6 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
         audit_log_query(original_query, response, client_ip, time.time() - start_time, success)
         return response
     
-    # Step 1: Clean query before auto-correction (remove extra punctuation)
-    import re
-    cleaned_query = re.sub(r'[^\w\s]', '', original_query).strip()
-    
     # Step 2: Auto-correct spelling DISABLED (can cause incorrect corrections of technical terms)
     # corrected_query = auto_correct_spelling(cleaned_query)
     corrected_query = cleaned_query  # Skip auto-correction
@@ -2413,31 +3139,14 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
         # Step 2: Check for statistics/count queries FIRST (but exclude borrowing limit queries)
         query_lower = query.lower()
         
-        # Patterns that indicate LIBRARY COLLECTION statistics
-        statistics_patterns = [
-            'total books in library', 'number of books in library',
-            'how many books in library', 'how many books does library have',
-            'how many books library have', 'books in library',
-            'library collection', 'collection size', 'total collection',
-            'library has how many', 'size of library'
-        ]
-        
-        # Patterns that indicate BORROWING LIMITS (general query, not statistics)
-        borrowing_patterns = [
-            'students get', 'students borrow', 'students can borrow',
-            'students can get', 'students issue', 'students can issue',
-            'can i borrow', 'can i get', 'can i issue',
-            'allowed to borrow', 'allowed to get', 'borrow limit',
-            'issue limit', 'borrowing limit', 'issuing limit',
-            'ug students', 'pg students', 'phd students',
-            'faculty get', 'staff get', 'professor get'
-        ]
+        # Statistics / borrowing-limit / "show more" patterns, matched in one pass
+        intent_matches = _intent_pattern_matcher.match(query_lower)
         
         # Check if it's a borrowing limit query (should be treated as general)
-        is_borrowing_query = any(pattern in query_lower for pattern in borrowing_patterns)
+        is_borrowing_query = 'borrowing' in intent_matches
         
         # Only trigger statistics if it's specifically about library collection AND NOT about borrowing
-        is_statistics_query = any(pattern in query_lower for pattern in statistics_patterns) and not is_borrowing_query
+        is_statistics_query = 'statistics' in intent_matches and not is_borrowing_query
         
         if is_statistics_query:
             logger.info("📊 Detected library collection statistics query")
@@ -2448,20 +3157,14 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
                 return "⚠️ I couldn't retrieve the library statistics at this time. Please try again later."
         
         # Check for "show more books" requests
-        show_more_patterns = [
-            'show more books', 'more books', 'show more', 'yes show more',
-            'yes, show more', 'see more books', 'view more books',
-            'display more books', 'list more books', 'more results'
-        ]
-        
-        is_show_more_query = any(pattern in query_lower for pattern in show_more_patterns)
+        is_show_more_query = 'show_more' in intent_matches
         
         if is_show_more_query:
             logger.info("📚 Detected 'show more books' request")
             return "📚 **I'd be happy to show you more books!** However, I need to know what topic or subject you're interested in.<br><br>**Please search for a specific topic first** (like 'machine learning', 'physics', 'chemistry', etc.) and I'll show you the top 5 results. Then you can ask for more!<br><br>**Try asking:** *'Find books about [your topic]'*"
         
         # Check for accession number queries (bc: format)
-        accession_match = re.search(r'\bbc:(\d+)\b', original_query, re.IGNORECASE)
+        accession_match = _ACCESSION_QUERY_RE.search(original_query)
         if accession_match:
             accession_number = f"bc:{accession_match.group(1)}"
             logger.info(f"🔍 Detected accession number query: {accession_number}")
@@ -2506,7 +3209,7 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
                 return f"⚠️ I couldn't find details for accession number {accession_number}. Please check the number and try again."
         
         # Check for pure numeric queries (potential accession numbers)
-        pure_numeric_match = re.search(r'^\s*(\d+)\s*$', original_query.strip())
+        pure_numeric_match = _NUMERIC_QUERY_RE.match(original_query)
         if pure_numeric_match and len(pure_numeric_match.group(1)) >= 4:  # Accession numbers are typically 4+ digits
             accession_number = f"bc:{pure_numeric_match.group(1)}"
             logger.info(f"🔍 Detected potential accession number query: {accession_number}")
@@ -2569,8 +3272,8 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
             logger.info("🔒 Forced website search mode")
             query_type = 'website'
         else:  # auto mode
-            # Classify query using keyword-based classifier
-            query_type = classify_query(query)
+            # Classification from the keyword-based classifier (computed during validation)
+            query_type = classification
             
             # Check if book search is disabled - force book queries to general
             if query_type == 'book' and not _get_book_search_enabled():
@@ -2602,7 +3305,7 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
                     answer = general.get('answer', '')
                     
                     # Add conversational context based on query type
-                    prefix = _get_response_prefix(query.lower())
+                    prefix = _get_response_prefix(query_lower)
                     
                     # Convert markdown to HTML
                     formatted_answer = markdown_to_html(answer)
@@ -2638,8 +3341,7 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
             # Handle general query (auto mode: try JSON then website)
             try:
                 # Check if this was originally a book query but reclassified due to book search being disabled
-                original_classification = classify_query(query)
-                is_reclassified_book_query = (original_classification == 'book' and not _get_book_search_enabled())
+                is_reclassified_book_query = (classification == 'book' and not _get_book_search_enabled())
                 
                 # First, try general_queries.json
                 general = get_general_answer(query)
@@ -2648,7 +3350,7 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
                     answer = general.get('answer', '')
                     
                     # Conversational prefix based on query context
-                    prefix = _get_response_prefix(query.lower())
+                    prefix = _get_response_prefix(query_lower)
                     
                     # Convert markdown to HTML
                     formatted_answer = markdown_to_html(answer)
@@ -2763,9 +3465,54 @@ def get_nandu_response(q, search_mode: str = "auto", client_ip: str = "default")
         )
 
 
+# -------------------------
+# Cache Maintenance
+# -------------------------
+def clear_caches():
+    """
+    Drop every in-process query/result cache (classification, spelling, intent, expansion,
+    query embeddings, FAQ answers, collection statistics). Loaded models and indexes are kept.
+    """
+    for cached in (validate_and_classify, classify_query, auto_correct_spelling,
+                   extract_query_intent, expand_book_query, _encode_cached):
+        cached.cache_clear()
+    with _faq_result_cache_lock:
+        _faq_result_cache.clear()
+    _stats_cache.update(at=0.0, value=None)
+
+
 # ========================
 # MODULE INITIALIZATION
 # ========================
 # Lazy-load heavy models on first use to speed up startup and avoid
 # unnecessary GPU/CPU overhead for simple general queries.
-logger.info("🚀 Nandu Brain module loaded (lazy model init)")
\ No newline at end of file
+logger.info("🚀 Nandu Brain module loaded (lazy model init)")
+
+def _prewarm_general_index():
+    """Load whichever general-queries index semantic_search_general_queries() would use."""
+    if _general_index_is_current():
+        _load_general_faiss_resources()
+    elif GENERAL_QUERIES.exists():
+        _get_faq_index()
+
+def _preload_faiss():
+    """Pre-load the FAISS indexes so the first search doesn't pay read_index + mapping load."""
+    for name, loader in (("catalogue", _load_faiss_resources), ("general queries", _prewarm_general_index)):
+        try:
+            logger.info(f"🔄 Pre-loading {name} FAISS resources in background...")
+            start_time = time.time()
+            loader()
+            logger.info(f"✅ {name.capitalize()} FAISS resources pre-loaded in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            logger.warning(f"Failed to pre-load {name} FAISS: {e}")
+
+# Run at the end of import so every loader referenced above is already defined.
+# Eager mode loads inline: a background thread still holding a cache lock at fork time
+# would leave that lock held forever in every worker.
+if EAGER_LOAD:
+    _preload_faiss()
+else:
+    try:
+        threading.Thread(target=_preload_faiss, name="nandu-faiss-preload", daemon=True).start()
+    except Exception as e:
+        logger.warning(f"Could not start FAISS preloading: {e}")
\ No newline at end of file
@@ -2,6 +2,82 @@ import sqlite3
 import csv
 import os
 
+from catalogue_schema import CATALOGUE_SCHEMA_VERSION, apply_catalogue_migrations
+
+# Optional: pandas' C parser loads the CSV much faster than csv.reader
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+# Print import progress every N rows
+PROGRESS_EVERY = 10000
+
+# Columns per CSV row: a leading barcode followed by the nine catalogue fields
+CSV_COLUMNS = 10
+
+# catalogue table columns, in CSV order (CSV columns 1-9)
+CATALOGUE_FIELDS = ['call_number', 'isbn', 'title', 'subtitle', 'author',
+                    'pages', 'publisher', 'year', 'accession_number']
+
+INSERT_SQL = '''
+    INSERT INTO catalogue 
+    (call_number, isbn, title, subtitle, author, pages, publisher, year, accession_number)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def iter_catalogue_rows(csv_reader, stats):
+    """
+    Yield INSERT_SQL parameter tuples from CSV rows, counting outcomes in stats.
+
+    Feeding this generator straight to executemany() lets SQLite pull rows as the
+    file is read, so memory stays flat whatever the CSV size.
+    """
+    for row_num, row in enumerate(csv_reader, 1):
+        if len(row) < 9:  # Ensure we have enough columns
+            stats['failed'] += 1
+            if stats['failed'] <= 5:  # Show first few failures
+                print(f"Row {row_num}: Insufficient columns ({len(row)}): {row}")
+            continue
+        try:
+            row += [''] * (CSV_COLUMNS - len(row))
+            year = row[8].strip()
+            params = (row[1], row[2], row[3], row[4], row[5], row[6], row[7],
+                      int(year) if year.isdigit() else None, row[9])
+        except Exception as e:
+            stats['failed'] += 1
+            if stats['failed'] <= 5:
+                print(f"Row {row_num}: Error - {e}: {row}")
+            continue
+        stats['imported'] += 1
+        if stats['imported'] % PROGRESS_EVERY == 0:
+            print(f"Imported {stats['imported']} records...")
+        yield params
+
+def import_with_pandas(csv_file, conn):
+    """
+    Load the CSV with pandas and append it to the catalogue table; returns the row count.
+
+    Fields are read as strings with empty cells kept as '' (as the csv.reader path stores
+    them); year is coerced to an integer, non-numeric values becoming NULL.
+    """
+    df = pd.read_csv(
+        csv_file,
+        header=0,
+        usecols=range(1, CSV_COLUMNS),
+        names=CATALOGUE_FIELDS,
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8',
+        encoding_errors='replace',
+        on_bad_lines='warn',
+        engine='c',
+    )
+    df['year'] = pd.to_numeric(df['year'].str.strip(), errors='coerce').astype('Int64')
+    df.to_sql('catalogue', conn, if_exists='append', index=False, chunksize=PROGRESS_EVERY)
+    return len(df)
+
 def create_and_populate_database():
     """Re-create the catalogue database from CSV"""
     
@@ -22,6 +98,13 @@ def create_and_populate_database():
     
     # Create new database
     conn = sqlite3.connect(db_file)
+    # Bulk-load settings: the database is rebuilt from scratch, so durability during import is not needed
+    conn.executescript("""
+        PRAGMA journal_mode=OFF;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-200000;
+    """)
     cursor = conn.cursor()
     
     # Create catalogue table
@@ -40,51 +123,30 @@ def create_and_populate_database():
         )
     ''')
     
-    # Read and import CSV data
-    imported_count = 0
-    failed_count = 0
-    
-    with open(csv_file, 'r', encoding='utf-8', errors='replace') as file:
-        csv_reader = csv.reader(file)
-        
-        for row_num, row in enumerate(csv_reader, 1):
-            try:
-                if len(row) >= 9:  # Ensure we have enough columns
-                    cursor.execute('''
-                        INSERT INTO catalogue 
-                        (call_number, isbn, title, subtitle, author, pages, publisher, year, accession_number)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', [
-                        row[1] if len(row) > 1 else '',  # call_number
-                        row[2] if len(row) > 2 else '',  # isbn
-                        row[3] if len(row) > 3 else '',  # title
-                        row[4] if len(row) > 4 else '',  # subtitle
-                        row[5] if len(row) > 5 else '',  # author
-                        row[6] if len(row) > 6 else '',  # pages
-                        row[7] if len(row) > 7 else '',  # publisher
-                        int(row[8]) if len(row) > 8 and row[8].strip().isdigit() else None,  # year
-                        row[9] if len(row) > 9 else ''   # accession_number
-                    ])
-                    imported_count += 1
-                    
-                    # Show progress every 1000 rows
-                    if imported_count % 1000 == 0:
-                        print(f"Imported {imported_count} records...")
-                        
-                else:
-                    failed_count += 1
-                    if failed_count <= 5:  # Show first few failures
-                        print(f"Row {row_num}: Insufficient columns ({len(row)}): {row}")
-                        
-            except Exception as e:
-                failed_count += 1
-                if failed_count <= 5:
-                    print(f"Row {row_num}: Error - {e}: {row}")
+    # Read and import CSV data (the first line is the column header)
+    if HAS_PANDAS:
+        imported_count = import_with_pandas(csv_file, conn)
+        print(f"\nImport complete!")
+        print(f"Successfully imported: {imported_count} records")
+    else:
+        # Fallback: a single transaction, streamed row by row
+        stats = {'imported': 0, 'failed': 0}
+        conn.execute("BEGIN")
+        with open(csv_file, 'r', encoding='utf-8', errors='replace', newline='') as file:
+            csv_reader = csv.reader(file)
+            next(csv_reader, None)
+            cursor.executemany(INSERT_SQL, iter_catalogue_rows(csv_reader, stats))
+        conn.commit()
+        print(f"\nImport complete!")
+        print(f"Successfully imported: {stats['imported']} records")
+        print(f"Failed to import: {stats['failed']} records")
     
-    conn.commit()
-    print(f"\nImport complete!")
-    print(f"Successfully imported: {imported_count} records")
-    print(f"Failed to import: {failed_count} records")
+    # Build search structures once over the loaded data (cheaper than maintaining them per insert):
+    # LOWER() expression indexes, the FTS5 catalogue_fts table and the search_blob column
+    print(f"\nBuilding search indexes (schema v{CATALOGUE_SCHEMA_VERSION})...")
+    apply_catalogue_migrations(conn)
+    conn.execute("PRAGMA journal_mode=WAL")  # persistent; lets the chatbot read while it is running
+    print("Search indexes ready")
     
     # Test search for Five Laws book
     print(f"\n=== Testing Five Laws search ===")